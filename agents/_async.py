@@ -0,0 +1,62 @@
+# agents/_async.py
+"""
+Small asyncio helpers shared by the LANTERN agents.
+
+- RateLimiter
+    Thread-safe sliding-window limiter (timestamp deque) used to respect
+    a requests-per-minute quota across an agent's sync and async calls.
+
+Sync agent entry points deliberately do not drive coroutines through
+asyncio.run(): the Gemini async client is bound to the loop it was first
+used on, so they fan out the sync SDK calls over threads instead.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter.
+
+    At most `max_calls` acquisitions are granted within any `period`
+    seconds window. Async callers `await limiter.acquire()`, threaded
+    callers use `limiter.acquire_blocking()`; both draw on the same quota,
+    so one instance can be shared by an agent's sync and async paths.
+    """
+
+    def __init__(self, max_calls: int, period: float = 60.0) -> None:
+        self.max_calls = max(1, int(max_calls))
+        self.period = float(period)
+        # Granted (possibly future) slot times, ascending
+        self._stamps: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Book the next free slot; return the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            while self._stamps and now - self._stamps[0] >= self.period:
+                self._stamps.popleft()
+            slot = self._stamps[-1] if self._stamps else now
+            if len(self._stamps) >= self.max_calls:
+                slot = max(slot, self._stamps[-self.max_calls] + self.period)
+            slot = max(slot, now)
+            self._stamps.append(slot)
+            return slot - now
+
+    async def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
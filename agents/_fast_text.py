@@ -0,0 +1,36 @@
+# agents/_fast_text.py
+"""
+Text truncation helpers for the agents' fallback paths.
+
+These avoid tokenizing a whole OCR page when only its first few words are
+needed: the scan stops as soon as the word or character budget is spent.
+"""
+
+from __future__ import annotations
+
+import re
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def truncate_words(text: str, max_words: int, max_chars: int) -> str:
+    """
+    Return the first `max_words` whitespace-separated words of `text`,
+    single-space joined and capped at `max_chars` characters.
+
+    Equivalent to ``" ".join(text.split()[:max_words])[:max_chars]`` but
+    only touches the prefix of `text` that contributes to the result.
+    """
+    if max_words <= 0 or max_chars <= 0:
+        return ""
+
+    words = []
+    length = -1  # no separator before the first word
+    for m in _WORD_RE.finditer(text):
+        if len(words) >= max_words or length >= max_chars:
+            break
+        word = m.group()
+        words.append(word)
+        length += len(word) + 1
+
+    return " ".join(words)[:max_chars]
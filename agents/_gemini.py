@@ -0,0 +1,210 @@
+# agents/_gemini.py
+"""
+Process-wide Gemini SDK setup shared by the LANTERN agents.
+
+`google.generativeai.configure()` is global state: every call replaces the
+SDK's client manager and with it any pooled gRPC / HTTP connections.
+Agents therefore go through configure_gemini(), which only reconfigures
+the SDK when the key or transport actually changes, so all agents in a
+process share one set of keep-alive connections.
+
+call_with_retry() / call_with_retry_async() wrap individual requests with
+bounded exponential backoff on transient errors (429/5xx) and an optional
+CircuitBreaker that fails fast after repeated failures.
+
+get_model() additionally hands out one GenerativeModel per
+(model_name, api_key, transport, system_instruction), so instantiating
+many agents does not rebuild model objects. Static instructions passed as
+`system_instruction` are attached to the model once rather than repeated
+in every request body.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
+
+import asyncio
+import functools
+import os
+import random
+import threading
+import time
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None  # handled gracefully by the agents
+
+# Optional transport override: "grpc" (SDK default), "grpc_asyncio" or "rest".
+DEFAULT_TRANSPORT: Optional[str] = os.getenv("GEMINI_TRANSPORT") or None
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_configured: Optional[Tuple[str, Optional[str]]] = None
+
+
+def configure_gemini(api_key: str, transport: Optional[str] = None) -> None:
+    """
+    Configure the Gemini SDK once per (api_key, transport) combination.
+    """
+    global _configured
+    if genai is None:
+        raise ImportError("google-generativeai is not installed.")
+
+    with _lock:
+        if _configured == (api_key, transport):
+            return
+        kwargs = {"api_key": api_key}
+        if transport:
+            kwargs["transport"] = transport
+        genai.configure(**kwargs)
+        _configured = (api_key, transport)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_model(
+    model_name: str,
+    api_key: str,
+    transport: Optional[str],
+    system_instruction: Optional[str],
+) -> Any:
+    if system_instruction:
+        return genai.GenerativeModel(model_name, system_instruction=system_instruction)
+    return genai.GenerativeModel(model_name)
+
+
+def get_model(
+    model_name: str,
+    api_key: str,
+    transport: Optional[str] = None,
+    *,
+    system_instruction: Optional[str] = None,
+) -> Any:
+    """
+    Return the process-wide GenerativeModel for this configuration.
+    """
+    configure_gemini(api_key, transport)
+    with _lock:
+        return _cached_model(model_name, api_key, transport, system_instruction)
+
+
+# --------- Retries / circuit breaker -------------------------------------------
+
+try:
+    from google.api_core import exceptions as _gexc
+
+    TRANSIENT_ERRORS: Tuple[type, ...] = (
+        _gexc.ResourceExhausted,    # 429
+        _gexc.ServiceUnavailable,   # 503
+        _gexc.InternalServerError,  # 500
+        _gexc.DeadlineExceeded,     # 504
+    )
+except ImportError:
+    TRANSIENT_ERRORS = ()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Gemini while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After `threshold` consecutive failed calls the breaker opens for
+    `cooldown` seconds; during that window calls fail fast with
+    CircuitOpenError so callers go straight to their offline fallback.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.threshold = max(1, int(threshold))
+        self.cooldown = float(cooldown)
+        self._failures = 0
+        self._opened_until = 0.0
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        if time.monotonic() < self._opened_until:
+            raise CircuitOpenError("Gemini circuit breaker is open; skipping call.")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_until = 0.0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_until = time.monotonic() + self.cooldown
+                self._failures = 0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: ~0.5s, 1s, 2s, ... capped at 8s."""
+    return min(8.0, 0.5 * (2 ** attempt)) * (0.5 + random.random() / 2)
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    *,
+    retries: int,
+    breaker: Optional[CircuitBreaker] = None,
+) -> T:
+    """
+    Call `fn`, retrying up to `retries` times on transient API errors
+    (rate limiting / unavailable) with exponential backoff. Any other
+    exception is raised immediately.
+    """
+    if breaker is not None:
+        breaker.check()
+    attempt = 0
+    while True:
+        try:
+            result = fn()
+        except TRANSIENT_ERRORS:
+            if attempt >= retries:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            time.sleep(_backoff_delay(attempt))
+            attempt += 1
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+
+async def call_with_retry_async(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    retries: int,
+    breaker: Optional[CircuitBreaker] = None,
+) -> T:
+    """Async counterpart of call_with_retry()."""
+    if breaker is not None:
+        breaker.check()
+    attempt = 0
+    while True:
+        try:
+            result = await fn()
+        except TRANSIENT_ERRORS:
+            if attempt >= retries:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+            await asyncio.sleep(_backoff_delay(attempt))
+            attempt += 1
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
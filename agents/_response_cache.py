@@ -0,0 +1,167 @@
+# agents/_response_cache.py
+"""
+Exact-match response cache for Gemini calls.
+
+Responses are keyed by a SHA-256 digest of everything that determines the
+model output (model name, prompt text, image bytes). Hits are served from
+a bounded in-process LRU first and, when a `cache_dir` is configured, from
+per-key JSON files on disk so re-runs of the pipeline skip the API
+entirely for pages that were already processed. Disk entries are sharded
+into 256 subdirectories by the first two hex chars of the key, like the
+OCR cache.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+KeyPart = Union[str, bytes]
+
+
+class ResponseCache:
+    """
+    Two-level (memory + optional disk) cache of raw response texts.
+
+    The memory tier keeps the `max_memory_entries` most recently used
+    responses; older ones are still served from disk when configured.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_memory_entries: int = 1024,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_entries = max(1, int(max_memory_entries))
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @staticmethod
+    def make_key(*parts: KeyPart) -> str:
+        """Stable SHA-256 key over the given str/bytes parts."""
+        h = hashlib.sha256()
+        for part in parts:
+            data = part.encode("utf-8") if isinstance(part, str) else part
+            h.update(len(data).to_bytes(8, "little"))
+            h.update(data)
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                self._memory.move_to_end(key)
+        if hit is not None or self.cache_dir is None:
+            return hit
+
+        path = self._path(key)
+        if not path.exists():
+            flat = self.cache_dir / f"{key}.json"
+            if not flat.exists():
+                return None
+            # Entry from the unsharded layout: move it into its shard
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(flat, path)
+            except FileNotFoundError:
+                pass  # another process migrated it first
+            except OSError:
+                path = flat
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                text = json.load(f)["text"]
+        except Exception as e:
+            logger.warning("Failed to read response cache %s: %s", path, e)
+            return None
+
+        self._remember(key, text)
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        self._remember(key, text)
+        if self.cache_dir is None:
+            return
+        try:
+            _write_atomic(
+                self._path(key), json.dumps({"text": text}, ensure_ascii=False).encode("utf-8")
+            )
+        except Exception as e:
+            logger.warning("Failed to write response cache for %s: %s", key, e)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, text: str) -> None:
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        """Return the cached text for `key`, calling `compute()` on a miss."""
+        text = self.get(key)
+        if text is None:
+            text = compute()
+            self.set(key, text)
+        return text
+
+    async def get_or_compute_async(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[str]],
+    ) -> str:
+        """
+        Async variant of get_or_compute().
+
+        Concurrent misses on the same key share a single in-flight call.
+        """
+        text = self.get(key)
+        if text is not None:
+            return text
+
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            return await pending
+
+        task = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        try:
+            text = await task
+        finally:
+            self._inflight.pop(key, None)
+        self.set(key, text)
+        return text
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write `data` to a temp file next to `path` and os.replace it over
+    `path`, so a crash mid-write never leaves a truncated entry. Kept
+    local (rather than tools.ocr_tools.atomic_write) so agents/ does not
+    depend on tools/.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(data)
+            if os.getenv("FSYNC_WRITES", "false").lower() == "true":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
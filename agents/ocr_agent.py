@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import asyncio
+import io
 import os
-import pathlib
+import threading
+import time
+
+from ._async import RateLimiter
+from ._gemini import (
+    DEFAULT_TRANSPORT,
+    CircuitBreaker,
+    call_with_retry,
+    call_with_retry_async,
+    genai,
+    get_model,
+)
+from ._response_cache import ResponseCache
 
 try:
-    import google.generativeai as genai
+    from PIL import Image
 except ImportError:
-    genai = None  # handled gracefully below
+    Image = None  # blank / duplicate detection is skipped without Pillow
+
+
+# `engine` of the empty record returned for pages skipped as blank. These
+# records are never written to the persistent OCR cache.
+BLANK_ENGINE = "blank_skip"
 
 
 @dataclass
@@ -30,12 +51,60 @@ class OCRAgentConfig:
     use_mock_if_no_key:
         If True, fall back to deterministic mock OCR when no client is
         available so the pipeline never fully breaks.
+    max_concurrency:
+        Maximum number of in-flight Gemini requests in run_pages().
+    qpm:
+        Requests-per-minute quota respected by run_pages().
+    cache_dir:
+        Optional directory for the persistent response cache. Identical
+        images are only sent to Gemini once per cache.
+    batch_size:
+        Number of pages dispatched (and held in memory) per burst in
+        run_pages_batch().
+    transport:
+        Optional Gemini SDK transport ("grpc", "grpc_asyncio", "rest").
+    client:
+        Optional pre-built GenerativeModel (or compatible object) to use
+        instead of constructing one; lets several agents share a client.
+    file_api_min_bytes:
+        Images larger than this are uploaded once through the Gemini File
+        API and referenced by URI instead of being inlined (base64) in
+        every request. None disables the File API.
+    skip_blank_pages:
+        If True (and Pillow is installed), pages with almost no ink (blank
+        separator sheets) return an empty record with engine="blank_skip"
+        without a Gemini call. Off by default: a page is only judged from
+        its pixels, and a wrongly skipped page loses its text.
+    dedupe_similar_pages:
+        If True, pages whose perceptual difference hash is within a few
+        bits of a page already OCR'd by this agent reuse that result. Off
+        by default: near-identical layouts with different text could match.
+    max_retries:
+        Retries per page on transient Gemini errors (429 / 5xx), with
+        exponential backoff capped at 8 seconds.
+    breaker_threshold:
+        Consecutive failed pages after which Gemini is skipped (mock
+        output) for `breaker_cooldown` seconds.
+    breaker_cooldown:
+        Seconds the circuit breaker stays open once tripped.
     """
 
     gcp_api_key: Optional[str] = None
     google_api_key: Optional[str] = None
     model_name: str = os.getenv("GEMINI_OCR_MODEL", "gemini-1.5-flash")
     use_mock_if_no_key: bool = True
+    max_concurrency: int = 16
+    qpm: int = 500
+    cache_dir: Optional[str] = os.getenv("LLM_CACHE_DIR")
+    batch_size: int = 32
+    transport: Optional[str] = DEFAULT_TRANSPORT
+    client: Any = None
+    file_api_min_bytes: Optional[int] = 1_048_576
+    skip_blank_pages: bool = False
+    dedupe_similar_pages: bool = False
+    max_retries: int = int(os.getenv("MAX_OCR_RETRIES", "2"))
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 30.0
 
 
 class OCRAgent:
@@ -48,6 +117,10 @@ class OCRAgent:
 
     Public API:
       - run_page(image_path, page_meta=None) -> Dict[str, Any]
+      - run_pages(image_paths, page_metas=None) -> List[Dict[str, Any]]
+      - run_page_async(...) awaitable variant of run_page
+      - run_pages_async(...) awaitable variant of run_pages
+      - run_pages_batch(image_paths, page_metas=None) -> List[Dict[str, Any]]
       - run(...) alias for backwards compatibility
 
     Returned schema (best-effort, stable keys):
@@ -60,19 +133,39 @@ class OCRAgent:
         "confidence": float | None,
         "error": str | None,
         "model": str | None,
-        "engine": "gemini" | "mock" | "none"
+        "engine": "gemini" | "mock" | "none" | "blank_skip"
       }
     """
 
     def __init__(self, cfg: OCRAgentConfig):
         self.cfg = cfg
         self._client = None
+        self._cache = ResponseCache(cfg.cache_dir)
+        # dhash -> record of recently OCR'd pages (dedupe_similar_pages);
+        # shared by run_pages() worker threads, hence the lock
+        self._hash_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._hash_lock = threading.Lock()
+        self._breaker = CircuitBreaker(cfg.breaker_threshold, cfg.breaker_cooldown)
+        # One `cfg.qpm` quota for every call made through this agent
+        self._limiter = RateLimiter(cfg.qpm, period=60.0)
+        # Injected clients don't carry our system instruction, so the OCR
+        # prompt has to travel with each request for them.
+        self._prompt_in_contents = True
+
+        if cfg.client is not None:
+            self._client = cfg.client
+            return
 
         api_key = cfg.gcp_api_key or cfg.google_api_key
         if api_key and genai is not None:
             try:
-                genai.configure(api_key=api_key)
-                self._client = genai.GenerativeModel(cfg.model_name)
+                self._client = get_model(
+                    cfg.model_name,
+                    api_key,
+                    cfg.transport,
+                    system_instruction=_OCR_PROMPT,
+                )
+                self._prompt_in_contents = False
             except Exception:
                 # If anything goes wrong initializing the client, leave it as None.
                 self._client = None
@@ -91,6 +184,7 @@ class OCRAgent:
         cfg = OCRAgentConfig(
             gcp_api_key=env_cfg.get("gcp_api_key"),
             google_api_key=os.getenv("GOOGLE_API_KEY"),
+            max_retries=env_cfg.get("ocr_retries", 2),
         )
         return cls(cfg)
 
@@ -141,81 +235,129 @@ class OCRAgent:
               - model
               - engine
         """
-        # Early file-existence check for clearer errors
-        if not os.path.exists(image_path):
-            return {
-                "raw_text": "",
-                "clean_text": "",
-                "ocr_text": "",
-                "ocr_text_length": 0,
-                "confidence": None,
-                "error": f"File not found: {image_path}",
-                "model": self.cfg.model_name,
-                "engine": "none",
-            }
-
-        # If client is unavailable and mock mode is allowed, use deterministic mock
-        if self._client is None:
-            if self.cfg.use_mock_if_no_key:
-                return self._mock_response(image_path, page_meta)
-            else:
-                return {
-                    "raw_text": "",
-                    "clean_text": "",
-                    "ocr_text": "",
-                    "ocr_text_length": 0,
-                    "confidence": None,
-                    "error": "No Gemini client configured and mock mode disabled.",
-                    "model": self.cfg.model_name,
-                    "engine": "none",
-                }
+        precheck = self._precheck(image_path, page_meta)
+        if precheck is not None:
+            return precheck
 
         try:
             # Read image bytes
-            with open(image_path, "rb") as f:
-                img_bytes = f.read()
+            img_bytes = _read_file(image_path)
 
-            prompt = (
-                "You are an OCR engine. Return ONLY the visible text on this page. "
-                "Do not add commentary or explanations."
-            )
+            key = self._cache_key(img_bytes, image_path)
+            shortcut, dhash = self._short_circuit(key, img_bytes)
+            if shortcut is not None:
+                return shortcut
 
-            resp = self._client.generate_content(
-                contents=[
-                    {
-                        "role": "user",
-                        "parts": [
-                            {"text": prompt},
-                            {
-                                "inline_data": {
-                                    "data": img_bytes,
-                                    "mime_type": _guess_mime_type(image_path),
-                                }
-                            },
-                        ],
-                    }
-                ]
-            )
+            def _call() -> str:
+                contents = self._contents(img_bytes, image_path)
 
-            raw_text = (getattr(resp, "text", "") or "").strip()
-            clean_text = " ".join(raw_text.split())
-            length = len(clean_text)
-
-            return {
-                "raw_text": raw_text,
-                "clean_text": clean_text,
-                "ocr_text": raw_text,              # 🔑 alias used by notebooks / UI
-                "ocr_text_length": length,
-                "confidence": None,                # Gemini doesn't expose a simple scalar here
-                "error": None,
-                "model": self.cfg.model_name,
-                "engine": "gemini",
-            }
+                def _attempt() -> Any:
+                    # Every attempt, retries included, counts against the quota
+                    self._limiter.acquire_blocking()
+                    return self._client.generate_content(contents=contents)
+
+                resp = call_with_retry(
+                    _attempt, retries=self.cfg.max_retries, breaker=self._breaker
+                )
+                return _response_text(resp)
+
+            raw = self._cache.get_or_compute(key, _call)
+            return self._remember(dhash, self._record_from_text(raw))
 
         except Exception as e:
             # Fall back to mock so the pipeline never fully breaks
             return self._mock_response(image_path, page_meta, error=str(e))
 
+    def run_pages(
+        self,
+        image_paths: Sequence[str],
+        page_metas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run OCR on many pages concurrently.
+
+        Synchronous counterpart of run_pages_async(): run_page() is fanned
+        out over up to `cfg.max_concurrency` threads (the sync Gemini
+        client is thread-safe; its async client is tied to one event loop).
+        Results are returned in the same order as `image_paths`.
+        """
+        paths = [str(p) for p in image_paths]
+        metas = list(page_metas) if page_metas is not None else [None] * len(paths)
+        if len(paths) <= 1:
+            return [self.run_page(p, m) for p, m in zip(paths, metas)]
+
+        if self._client is not None:
+            _advise_willneed(paths)
+
+        workers = max(1, min(self.cfg.max_concurrency, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(self.run_page, paths, metas))
+
+    def run_pages_batch(
+        self,
+        image_paths: Sequence[str],
+        page_metas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run OCR over a large list of pages in bursts of `cfg.batch_size`.
+
+        Each burst is dispatched concurrently via run_pages(), so only one
+        burst worth of image bytes is resident at a time. Pages are not
+        packed into a single request: inline image payloads are capped per
+        request and one bad page would fail the whole batch.
+        """
+        paths = list(image_paths)
+        metas = list(page_metas) if page_metas is not None else [None] * len(paths)
+        size = max(1, self.cfg.batch_size)
+
+        out: List[Dict[str, Any]] = []
+        for i in range(0, len(paths), size):
+            out.extend(self.run_pages(paths[i : i + size], metas[i : i + size]))
+        return out
+
+    async def run_pages_async(
+        self,
+        image_paths: Sequence[str],
+        page_metas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run OCR on many pages with bounded concurrency.
+
+        At most `cfg.max_concurrency` requests are in flight at once and
+        no more than `cfg.qpm` requests are issued per minute. Each page
+        falls back to mock output independently on failure.
+        """
+        paths = [str(p) for p in image_paths]
+        metas = list(page_metas) if page_metas is not None else [None] * len(paths)
+
+        # Queue kernel readahead for the whole batch up front so image reads
+        # are served from the page cache by the time each request needs them.
+        if self._client is not None:
+            _advise_willneed(paths)
+
+        sem = asyncio.Semaphore(max(1, self.cfg.max_concurrency))
+
+        async def _bounded(path: str, meta: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            async with sem:
+                return await self._run_page_async(path, meta)
+
+        return list(
+            await asyncio.gather(
+                *(_bounded(p, m) for p, m in zip(paths, metas))
+            )
+        )
+
+    async def run_page_async(
+        self,
+        image_path: str,
+        page_meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Awaitable variant of run_page() for callers that bound concurrency
+        themselves. Requests still share the agent's `cfg.qpm` limit.
+        """
+        return await self._run_page_async(str(image_path), page_meta)
+
     # Backwards-compatible alias for older code that calls ocr_agent.run(...)
     def run(
         self,
@@ -227,6 +369,218 @@ class OCRAgent:
 
     # --------- Internals ----------------------------------------------------
 
+    async def _run_page_async(
+        self,
+        image_path: str,
+        page_meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Async counterpart of run_page() using generate_content_async."""
+        precheck = self._precheck(image_path, page_meta)
+        if precheck is not None:
+            return precheck
+
+        try:
+            # Disk read runs off the event loop so it overlaps in-flight requests
+            img_bytes = await asyncio.to_thread(_read_file, image_path)
+
+            async def _call() -> str:
+                if self._wants_file_api(len(img_bytes)):
+                    # Upload is a blocking SDK call; keep it off the loop
+                    contents = await asyncio.to_thread(self._contents, img_bytes, image_path)
+                else:
+                    contents = self._contents(img_bytes, image_path)
+
+                async def _attempt() -> Any:
+                    # Every attempt, retries included, counts against the quota
+                    await self._limiter.acquire()
+                    return await self._client.generate_content_async(contents=contents)
+
+                resp = await call_with_retry_async(
+                    _attempt, retries=self.cfg.max_retries, breaker=self._breaker
+                )
+                return _response_text(resp)
+
+            key = self._cache_key(img_bytes, image_path)
+            shortcut, dhash = await self._short_circuit_async(key, img_bytes)
+            if shortcut is not None:
+                return shortcut
+
+            raw = await self._cache.get_or_compute_async(key, _call)
+            return self._remember(dhash, self._record_from_text(raw))
+
+        except Exception as e:
+            return self._mock_response(image_path, page_meta, error=str(e))
+
+    def _precheck(
+        self,
+        image_path: str,
+        page_meta: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve pages that never reach Gemini (missing file / no client).
+
+        Returns the final record for such pages, or None if the page
+        should be sent to the model.
+        """
+        # Early file-existence check for clearer errors
+        if not os.path.exists(image_path):
+            return self._error_record(f"File not found: {image_path}")
+
+        # If client is unavailable and mock mode is allowed, use deterministic mock
+        if self._client is None:
+            if self.cfg.use_mock_if_no_key:
+                return self._mock_response(image_path, page_meta)
+            return self._error_record(
+                "No Gemini client configured and mock mode disabled."
+            )
+
+        return None
+
+    def _error_record(self, error: str) -> Dict[str, Any]:
+        return {
+            "raw_text": "",
+            "clean_text": "",
+            "ocr_text": "",
+            "ocr_text_length": 0,
+            "confidence": None,
+            "error": error,
+            "model": self.cfg.model_name,
+            "engine": "none",
+        }
+
+    def _short_circuit(
+        self,
+        key: str,
+        img_bytes: bytes,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """
+        Resolve a page without calling Gemini when possible.
+
+        Returns (record, dhash): record is set for cached, blank or
+        duplicate pages; dhash is the page's perceptual hash (if computed)
+        so the fresh result can be remembered for later duplicates.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._record_from_text(cached), None
+        if not self._wants_signature():
+            return None, None
+        return self._apply_signature(
+            _image_signature(img_bytes, self.cfg.skip_blank_pages)
+        )
+
+    async def _short_circuit_async(
+        self,
+        key: str,
+        img_bytes: bytes,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """
+        Async counterpart of _short_circuit(); the image decode + hash runs
+        in a worker thread (Pillow releases the GIL while decoding) so it
+        overlaps with in-flight requests instead of blocking the event loop.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._record_from_text(cached), None
+        if not self._wants_signature():
+            return None, None
+
+        sig = await asyncio.to_thread(
+            _image_signature, img_bytes, self.cfg.skip_blank_pages
+        )
+        return self._apply_signature(sig)
+
+    def _wants_signature(self) -> bool:
+        return Image is not None and (
+            self.cfg.skip_blank_pages or self.cfg.dedupe_similar_pages
+        )
+
+    def _apply_signature(
+        self,
+        sig: Optional[Tuple[int, bool]],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        if sig is None:
+            return None, None
+        dhash, blank = sig
+
+        if blank and self.cfg.skip_blank_pages:
+            return self._blank_record(), None
+        if not self.cfg.dedupe_similar_pages:
+            return None, None
+
+        with self._hash_lock:
+            dup = self._hash_cache.get(dhash)
+            if dup is not None:
+                self._hash_cache.move_to_end(dhash)
+            seen_pages = list(self._hash_cache.items()) if dup is None else []
+        # Re-encoded / re-scanned copies differ in a few bits only
+        for seen, record in seen_pages:
+            if (seen ^ dhash).bit_count() <= _DHASH_MAX_DISTANCE:
+                dup = record
+                break
+        if dup is not None:
+            return dict(dup), None
+        return None, dhash
+
+    def _remember(self, dhash: Optional[int], record: Dict[str, Any]) -> Dict[str, Any]:
+        if dhash is not None:
+            with self._hash_lock:
+                self._hash_cache[dhash] = dict(record)
+                self._hash_cache.move_to_end(dhash)
+                while len(self._hash_cache) > _DHASH_CACHE_MAX_PAGES:
+                    self._hash_cache.popitem(last=False)
+        return record
+
+    def _blank_record(self) -> Dict[str, Any]:
+        record = self._error_record("")
+        record["error"] = None
+        record["engine"] = BLANK_ENGINE
+        return record
+
+    def _wants_file_api(self, size: int) -> bool:
+        threshold = self.cfg.file_api_min_bytes
+        return threshold is not None and size > threshold and genai is not None
+
+    def _contents(self, img_bytes: bytes, image_path: str) -> List[Dict[str, Any]]:
+        """
+        Request payload for a page: a File API reference for large images
+        (uploaded once, reused while the upload is fresh), inline bytes
+        otherwise or if the upload fails.
+        """
+        if self._wants_file_api(len(img_bytes)):
+            file_ref = _uploaded_file_ref(image_path)
+            if file_ref is not None:
+                return _build_contents(
+                    None,
+                    image_path,
+                    file_ref=file_ref,
+                    include_prompt=self._prompt_in_contents,
+                )
+        return _build_contents(
+            img_bytes, image_path, include_prompt=self._prompt_in_contents
+        )
+
+    def _cache_key(self, img_bytes: bytes, image_path: str) -> str:
+        return ResponseCache.make_key(
+            self.cfg.model_name, _OCR_PROMPT, _guess_mime_type(image_path), img_bytes
+        )
+
+    def _record_from_text(self, raw: str) -> Dict[str, Any]:
+        raw_text = raw.strip()
+        clean_text = " ".join(raw_text.split())
+        length = len(clean_text)
+
+        return {
+            "raw_text": raw_text,
+            "clean_text": clean_text,
+            "ocr_text": raw_text,              # 🔑 alias used by notebooks / UI
+            "ocr_text_length": length,
+            "confidence": None,                # Gemini doesn't expose a simple scalar here
+            "error": None,
+            "model": self.cfg.model_name,
+            "engine": "gemini",
+        }
+
     def _mock_response(
         self,
         image_path: str,
@@ -257,17 +611,192 @@ class OCRAgent:
 
 # --------- Helper -----------------------------------------------------------
 
+_MIME_BY_SUFFIX = {
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".tiff": "image/tiff",
+    ".tif": "image/tiff",
+}
+
+_OCR_PROMPT = (
+    "You are an OCR engine. Return ONLY the visible text on this page. "
+    "Do not add commentary or explanations."
+)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _advise_willneed(paths: Sequence[str]) -> None:
+    """
+    Hint the kernel to start reading every file in `paths` in the background.
+
+    posix_fadvise(WILLNEED) only queues readahead, so issuing it for a whole
+    batch lets the device work through the reads in parallel. No-op on
+    platforms without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# Difference-hash grid (columns x rows) and the Hamming distance under which
+# two pages count as duplicates.
+_DHASH_SIZE = 16
+_DHASH_MAX_DISTANCE = 8
+# Most recent pages kept for near-duplicate lookups (the scan is linear)
+_DHASH_CACHE_MAX_PAGES = 4096
+
+# Blank detection: pages are decoded to at least this size (JPEG DCT
+# scaling; ~850x1100 for a 1700x2200 scan) so text strokes survive, and
+# count as blank when fewer than _BLANK_MAX_INK_RATIO of their pixels are
+# "ink", i.e. differ from the page's median gray by _BLANK_INK_DELTA or
+# more. A single line of small type is ~3e-4; scanner specks ~2e-5.
+_BLANK_DECODE_SIZE = 512
+_BLANK_INK_DELTA = 64
+_BLANK_MAX_INK_RATIO = 1e-4
+
+
+def _image_signature(
+    img_bytes: bytes,
+    check_blank: bool = False,
+) -> Optional[Tuple[int, bool]]:
+    """
+    Return (dhash, is_blank) for an encoded image, or None if it cannot be
+    decoded (or Pillow is unavailable).
+
+    dhash is a _DHASH_SIZE**2-bit difference hash of the grayscale image;
+    is_blank (only computed when `check_blank`, else False) flags pages
+    with almost no ink.
+    """
+    if Image is None:
+        return None
+    size = _BLANK_DECODE_SIZE if check_blank else _DHASH_SIZE * 8
+    try:
+        with Image.open(io.BytesIO(img_bytes)) as im:
+            # JPEG: decode at reduced scale directly (DCT scaling)
+            im.draft("L", (size, size))
+            gray = im.convert("L")
+    except Exception:
+        return None
+
+    blank = check_blank and _is_blank(gray)
+
+    small = gray.resize((_DHASH_SIZE + 1, _DHASH_SIZE))
+    px = list(small.getdata())
+    width = _DHASH_SIZE + 1
+    dhash = 0
+    for row in range(_DHASH_SIZE):
+        base = row * width
+        for col in range(_DHASH_SIZE):
+            dhash = (dhash << 1) | (px[base + col] > px[base + col + 1])
+    return dhash, blank
+
+
+def _is_blank(gray: "Image.Image") -> bool:
+    """Ink-ratio test on a grayscale page (see _BLANK_* above)."""
+    hist = gray.histogram()
+    total = gray.width * gray.height
+    if not total:
+        return True
+
+    # Median gray level ~ the paper color
+    seen = 0
+    median = 0
+    for level, count in enumerate(hist):
+        seen += count
+        if seen * 2 >= total:
+            median = level
+            break
+
+    lo = max(0, median - _BLANK_INK_DELTA + 1)
+    hi = min(256, median + _BLANK_INK_DELTA)
+    ink = total - sum(hist[lo:hi])
+    return ink < total * _BLANK_MAX_INK_RATIO
+
+
+def _response_text(resp: Any) -> str:
+    return getattr(resp, "text", "") or ""
+
+
+def _build_contents(
+    img_bytes: Optional[bytes],
+    image_path: str,
+    *,
+    file_ref: Any = None,
+    include_prompt: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Build the Gemini `contents` payload for a single page image.
+
+    With include_prompt=False only the image is sent; the OCR instruction
+    is then expected to live on the model as its system instruction.
+    """
+    if file_ref is not None:
+        image_part: Any = file_ref
+    else:
+        image_part = {
+            "inline_data": {
+                "data": img_bytes,
+                "mime_type": _guess_mime_type(image_path),
+            }
+        }
+    parts: List[Any] = [{"text": _OCR_PROMPT}] if include_prompt else []
+    parts.append(image_part)
+    return [{"role": "user", "parts": parts}]
+
+
+# Uploaded files expire server-side after 48h; re-upload well before that.
+_UPLOAD_TTL_SECONDS = 24 * 3600
+_uploads: Dict[Tuple[str, int, int], Tuple[Any, float]] = {}
+_uploads_lock = threading.Lock()
+
+
+def _uploaded_file_ref(image_path: str) -> Any:
+    """
+    Return a Gemini File API handle for `image_path`, uploading at most once
+    per (path, mtime, size) while the upload is fresh. None on failure.
+    """
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    key = (os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
+
+    with _uploads_lock:
+        hit = _uploads.get(key)
+    if hit is not None and time.time() - hit[1] < _UPLOAD_TTL_SECONDS:
+        return hit[0]
+
+    try:
+        file_ref = genai.upload_file(path=image_path, mime_type=_guess_mime_type(image_path))
+    except Exception:
+        return None
+
+    with _uploads_lock:
+        _uploads[key] = (file_ref, time.time())
+    return file_ref
+
+
 def _guess_mime_type(path: str) -> str:
     """
     Very small helper to guess a sensible mime type from the file extension.
     Defaults to image/jpeg if unsure.
     """
-    suffix = pathlib.Path(path).suffix.lower()
-    if suffix in {".png"}:
-        return "image/png"
-    if suffix in {".webp"}:
-        return "image/webp"
-    if suffix in {".tiff", ".tif"}:
-        return "image/tiff"
-    # Fallback
-    return "image/jpeg"
\ No newline at end of file
+    dot = path.rfind(".")
+    # No extension, a dot in a directory name, or a dotfile like ".png"
+    if dot <= 0 or path[dot - 1] in "/\\" or "/" in path[dot:] or "\\" in path[dot:]:
+        return "image/jpeg"
+    return _MIME_BY_SUFFIX.get(path[dot:].lower(), "image/jpeg")
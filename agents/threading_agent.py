@@ -23,8 +23,25 @@ import logging
 import math
 from collections import defaultdict
 
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
 logger = logging.getLogger(__name__)
 
+# Strings that parse as a float; anything else sorts last like in group_sequences.
+_NUMERIC_RE = r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$"
+
 
 @dataclass
 class ThreadingAgentConfig:
@@ -68,6 +85,19 @@ class ThreadingAgent:
         ThreadingAgent.group_sequences(rows: List[Dict[str, Any]])
             -> Dict[str, List[Dict[str, Any]]]
 
+        ThreadingAgent.group_sequences_df(df: pandas.DataFrame)
+            -> Dict[str, List[Dict[str, Any]]]   (vectorized equivalent)
+
+        ThreadingAgent.group_sequences_arrow(table: pyarrow.Table)
+            -> Dict[str, List[Dict[str, Any]]]   (columnar / Arrow equivalent)
+
+        ThreadingAgent.from_frame(df) / ThreadingAgent.from_rows(rows)
+            -> pyarrow.Table                    (input for the Arrow path)
+
+    The columnar variants keep the manifest as per-column arrays for the
+    whole grouping step; per-row dict access only happens at the boundary,
+    when the result mapping is materialized.
+
     The returned mapping is:
 
         sequence_id (str) -> ordered list of manifest rows
@@ -185,4 +215,227 @@ class ThreadingAgent:
             len(rows),
             len(ordered),
         )
-        return ordered
\ No newline at end of file
+        return ordered
+
+    def group_sequences_df(self, df: "pd.DataFrame") -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Vectorized equivalent of group_sequences() for a manifest DataFrame.
+
+        Missing-ID detection, singleton key assignment and ordering are all
+        computed column-wise; rows are only converted to dicts once, at the
+        end, when the result mapping is assembled. The output (key order,
+        row order, key format) matches group_sequences(df.to_dict("records")).
+        """
+        if pd is None:
+            raise ImportError("group_sequences_df requires pandas to be installed.")
+
+        if df.empty:
+            logger.info("ThreadingAgent.group_sequences_df called with 0 rows.")
+            return {}
+
+        n = len(df)
+        if "file_path" in df.columns:
+            file_paths = df["file_path"].astype(str)
+        else:
+            file_paths = pd.Series(["<unknown>"] * n, index=df.index)
+
+        # No-thread mode: treat each row as its own sequence
+        if not self.config.enable_threads:
+            logger.info(
+                "ThreadingAgent running in 'no-thread' mode; "
+                "treating each row as its own sequence."
+            )
+            if "file_path" not in df.columns:
+                file_paths = pd.Series([f"seq_{i}" for i in range(n)], index=df.index)
+            records = df.to_dict(orient="records")
+            return {fp: [rec] for fp, rec in zip(file_paths, records)}
+
+        if "sequence_id" in df.columns:
+            seq = df["sequence_id"]
+            seq_str = seq.astype(str)
+            missing = seq.isna() | (seq_str.str.strip() == "")
+            keys = seq_str.where(~missing, "singleton::" + file_paths)
+        else:
+            keys = "singleton::" + file_paths
+
+        if "sequence_order" in df.columns:
+            order = pd.to_numeric(df["sequence_order"], errors="coerce").fillna(1e9)
+        else:
+            order = pd.Series(1e9, index=df.index)
+
+        # Group codes follow first appearance, like the dict-based path;
+        # lexsort is stable so ties keep manifest order.
+        codes, uniques = pd.factorize(keys, sort=False)
+        perm = np.lexsort((order.to_numpy(dtype=float), codes))
+        sorted_codes = codes[perm]
+
+        records = df.iloc[perm].to_dict(orient="records")
+        bounds = (np.flatnonzero(np.diff(sorted_codes)) + 1).tolist()
+        starts = [0, *bounds]
+        ends = [*bounds, n]
+
+        ordered: Dict[str, List[Dict[str, Any]]] = {
+            str(uniques[sorted_codes[s]]): records[s:e]
+            for s, e in zip(starts, ends)
+        }
+
+        logger.info(
+            "ThreadingAgent grouped %d rows into %d sequences.",
+            n,
+            len(ordered),
+        )
+        return ordered
+
+    # --------- Arrow / columnar path ----------------------------------------
+
+    @staticmethod
+    def from_rows(rows: List[Dict[str, Any]]) -> "pa.Table":
+        """
+        Materialize manifest rows as a pyarrow Table (one array per column).
+
+        NaN floats (how pandas encodes empty cells) become nulls, and a
+        column whose values do not share one Arrow type (e.g. ints mixed
+        with strings) is stored as strings.
+        """
+        if pa is None:
+            raise ImportError("from_rows requires pyarrow to be installed.")
+
+        columns: Dict[str, List[Any]] = {}
+        for row in rows:
+            for key in row:
+                columns.setdefault(key, [])
+        for row in rows:
+            for key, values in columns.items():
+                v = row.get(key)
+                values.append(None if isinstance(v, float) and math.isnan(v) else v)
+
+        arrays = {}
+        for key, values in columns.items():
+            try:
+                arrays[key] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrays[key] = pa.array(
+                    [None if v is None else str(v) for v in values], pa.string()
+                )
+        return pa.table(arrays)
+
+    @staticmethod
+    def from_frame(df: "pd.DataFrame") -> "pa.Table":
+        """
+        Convert a manifest DataFrame to a pyarrow Table without going through
+        rows; falls back to from_rows() when a column mixes Python types.
+        """
+        if pa is None:
+            raise ImportError("from_frame requires pyarrow to be installed.")
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return ThreadingAgent.from_rows(df.to_dict(orient="records"))
+
+    def group_sequences_arrow(self, table: "pa.Table") -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Columnar equivalent of group_sequences() over a pyarrow Table.
+
+        Missing IDs are resolved with Arrow compute kernels, rows are
+        ordered with one stable multi-key sort_indices, and each sequence
+        is a contiguous slice of the sorted table; rows are converted to
+        dicts only when the result mapping is built.
+        """
+        if pa is None:
+            raise ImportError("group_sequences_arrow requires pyarrow to be installed.")
+
+        n = table.num_rows
+        if n == 0:
+            logger.info("ThreadingAgent.group_sequences_arrow called with 0 rows.")
+            return {}
+
+        names = table.column_names
+        if "file_path" in names:
+            file_paths = _as_str_array(table["file_path"])
+        else:
+            file_paths = pa.array(["<unknown>"] * n, pa.string())
+
+        # No-thread mode: treat each row as its own sequence
+        if not self.config.enable_threads:
+            logger.info(
+                "ThreadingAgent running in 'no-thread' mode; "
+                "treating each row as its own sequence."
+            )
+            if "file_path" not in names:
+                file_paths = pa.array([f"seq_{i}" for i in range(n)], pa.string())
+            return {
+                fp: [rec]
+                for fp, rec in zip(file_paths.to_pylist(), table.to_pylist())
+            }
+
+        singleton = pc.binary_join_element_wise("singleton::", file_paths, "")
+        if "sequence_id" in names:
+            seq = _as_str_array(table["sequence_id"])
+            keys = pc.if_else(pa.array(_missing_mask(seq)), singleton, seq)
+        else:
+            keys = singleton
+
+        if "sequence_order" in names:
+            order = table["sequence_order"]
+            if pa.types.is_string(order.type) or pa.types.is_large_string(order.type):
+                numeric = pc.match_substring_regex(order, _NUMERIC_RE)
+                order = pc.if_else(numeric, order, pa.scalar(None, order.type))
+            order = pc.fill_null(pc.cast(order, pa.float64()), 1e9)
+        else:
+            order = pa.array([1e9] * n, pa.float64())
+
+        # Group codes follow first appearance, like the dict-based path;
+        # sort_indices is stable so ties keep manifest order.
+        uniques = pc.unique(keys)
+        codes = pc.index_in(keys, value_set=uniques)
+        work = pa.table({"code": codes, "order": order})
+        perm = pc.sort_indices(work, sort_keys=[("code", "ascending"), ("order", "ascending")])
+
+        sorted_table = table.take(perm)
+        sorted_codes = np.asarray(pc.take(codes, perm))
+        bounds = (np.flatnonzero(np.diff(sorted_codes)) + 1).tolist()
+        starts = [0, *bounds]
+        ends = [*bounds, n]
+        unique_keys = uniques.to_pylist()
+
+        ordered: Dict[str, List[Dict[str, Any]]] = {
+            unique_keys[sorted_codes[s]]: sorted_table.slice(s, e - s).to_pylist()
+            for s, e in zip(starts, ends)
+        }
+
+        logger.info(
+            "ThreadingAgent grouped %d rows into %d sequences.",
+            n,
+            len(ordered),
+        )
+        return ordered
+
+
+def _as_str_array(col: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    """Cast a column to strings, formatting floats like str() ("1.0", not "1")."""
+    if pa.types.is_floating(col.type):
+        return pa.chunked_array(
+            [[None if v is None else str(v) for v in col.to_pylist()]], pa.string()
+        )
+    return pc.cast(col, pa.string())
+
+
+def _missing_mask(seq: "pa.ChunkedArray") -> "np.ndarray":
+    """
+    Boolean mask of null or blank (whitespace-only) sequence IDs.
+
+    After trimming, blank IDs are exactly the zero-length entries, which
+    are read straight off each string chunk's offsets buffer with NumPy
+    (no per-value string comparison).
+    """
+    trimmed = pc.utf8_trim_whitespace(seq)
+    parts = []
+    for chunk in trimmed.chunks:
+        offset_type = np.int64 if pa.types.is_large_string(chunk.type) else np.int32
+        offsets = np.frombuffer(chunk.buffers()[1], dtype=offset_type)
+        offsets = offsets[chunk.offset : chunk.offset + len(chunk) + 1]
+        empty = (offsets[1:] - offsets[:-1]) == 0
+        parts.append(empty | chunk.is_null().to_numpy(zero_copy_only=False))
+    if not parts:
+        return np.zeros(0, dtype=bool)
+    return np.concatenate(parts)
@@ -25,10 +25,14 @@ Primary entry point
         export_jsonl=True,                 # optional
     )
 
+    run_pipeline_async(...) takes the same arguments and OCRs cache
+    misses on an event loop instead of a thread pool.
+
 Responsibilities
 ----------------
 1. Iterate over manifest rows.
-2. Run OCR on each image (with optional disk cache).
+2. Run OCR on each image (with optional disk cache; cache misses run in a
+   thread pool).
 3. Group rows into sequences/threads via ThreadingAgent.
 4. Produce page-level and sequence-level enriched records via ExtractionAgent.
 5. Optionally export those records to disk in JSONL format.
@@ -57,17 +61,33 @@ Design Notes
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, BinaryIO, Dict, List, Tuple, Optional
 
-import json
+import asyncio
+import hashlib
 import logging
+import mmap
+import os
 
 import pandas as pd
 
-from agents.ocr_agent import OCRAgent
+try:
+    import pyarrow  # Parquet engine for DataFrame.to_parquet; Arrow grouping
+except ImportError:
+    pyarrow = None
+
+from agents.ocr_agent import BLANK_ENGINE, OCRAgent
 from agents.threading_agent import ThreadingAgent
 from agents.extraction_agent import ExtractionAgent
+from tools.ocr_tools import (
+    atomic_write,
+    cache_path_for,
+    image_cache_path_for,
+    json_dumps,
+    json_loads,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -79,70 +99,176 @@ SequenceRecord = Dict[str, Any]
 # ---------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------
-def _cache_key_for_path(rel_path: str) -> str:
+def _image_digest(image_path: Path) -> Optional[str]:
     """
-    Turn a relative file path into a safe cache file name.
+    128-bit blake2b digest of an image file's bytes, or None if unreadable.
 
-    Example
-    -------
-    "A_clean_ocr/HOUSE_OVERSIGHT_011638.jpg"
-        -> "A_clean_ocr__HOUSE_OVERSIGHT_011638.jpg.json"
+    The file is hashed through a read-only mmap so its contents are never
+    copied into a Python bytes object.
     """
-    return rel_path.replace("/", "__") + ".json"
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with image_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    h.update(mm)
+    except (OSError, ValueError):
+        return None
+    return h.hexdigest()
+
+
+def _read_cache_file(cache_file: Path, rel_path: str) -> Optional[PageRecord]:
+    try:
+        with cache_file.open("rb") as f:
+            return json_loads(f.read())
+    except Exception as e:
+        logger.warning("Failed to load OCR cache for %s: %s", rel_path, e)
+        return None
 
 
-def _load_ocr_from_cache(cache_dir: Path, rel_path: str) -> Optional[PageRecord]:
+def _load_ocr_from_cache(
+    cache_dir: Path,
+    rel_path: str,
+    image_digest: Optional[str] = None,
+) -> Optional[PageRecord]:
     """
     Attempt to load a cached OCR record from disk.
 
+    When `image_digest` is given, the content-addressed entry is tried
+    first, so moved / renamed / duplicated images still hit the cache;
+    otherwise (or on a miss) the path-keyed entry is used.
+
+    Both entries live in the tools.ocr_tools cache layout (see
+    cache_path_for / image_cache_path_for), which also migrates files
+    from the old flat layout.
+
     Returns
     -------
     dict | None
         The cached OCR record if present and valid, otherwise None.
     """
-    cache_file = cache_dir / _cache_key_for_path(rel_path)
+    if image_digest is not None:
+        digest_file = image_cache_path_for(cache_dir, image_digest)
+        if digest_file.exists():
+            data = _read_cache_file(digest_file, rel_path)
+            if isinstance(data, dict):
+                data.pop("_rel_path", None)
+                data.pop("image_digest", None)
+                return data
+
+    cache_file = cache_path_for(cache_dir, rel_path)
     if not cache_file.exists():
         return None
 
-    try:
-        with cache_file.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data
-    except Exception as e:
-        logger.warning("Failed to load OCR cache for %s: %s", rel_path, e)
+    data = _read_cache_file(cache_file, rel_path)
+
+    # Guard against (astronomically unlikely) digest collisions
+    if isinstance(data, dict) and data.pop("_rel_path", rel_path) != rel_path:
         return None
+    return data
 
 
-def _save_ocr_to_cache(cache_dir: Path, rel_path: str, record: PageRecord) -> None:
+def _save_ocr_to_cache(
+    cache_dir: Path,
+    rel_path: str,
+    record: PageRecord,
+    image_digest: Optional[str] = None,
+) -> None:
     """
     Save an OCR record to disk as JSON.
 
+    Records are keyed by `image_digest` (content-addressed) when given,
+    else by `rel_path`. The source path and digest are stored alongside
+    the record for provenance.
+
     This assumes that `record` is JSON-serializable (dict of primitives).
+    Blank-page skips (engine "blank_skip") are not persisted, so turning
+    skip_blank_pages off later re-OCRs those pages.
     """
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_dir / _cache_key_for_path(rel_path)
+    if record.get("engine") == BLANK_ENGINE:
+        return
+    if image_digest is not None:
+        cache_file = image_cache_path_for(cache_dir, image_digest)
+        payload = {"_rel_path": rel_path, "image_digest": image_digest, **record}
+    else:
+        cache_file = cache_path_for(cache_dir, rel_path)
+        payload = {"_rel_path": rel_path, **record}
 
     try:
-        with cache_file.open("w", encoding="utf-8") as f:
-            json.dump(record, f, ensure_ascii=False, indent=2)
+        # Written to a temp file and renamed, so concurrent readers and
+        # crashes never see a truncated record
+        with atomic_write(cache_file) as f:
+            f.write(json_dumps(payload, indent=True))
     except Exception as e:
         logger.warning("Failed to write OCR cache for %s: %s", rel_path, e)
 
 
+def _usable_cached_record(cached: PageRecord) -> bool:
+    """
+    Whether a cached OCR record can be reused.
+
+    Cached OCR is considered "bad" if it has no usable text AND either an
+    error or an engine that never read the page ("blank_skip", "none").
+    """
+    has_text = any(
+        isinstance(cached.get(k), str) and cached[k].strip()
+        for k in ("clean_text", "raw_text", "ocr_text")
+    )
+    if has_text:
+        return True
+    return not (cached.get("error") or cached.get("engine") in (BLANK_ENGINE, "none"))
+
+
+def _default_ocr_workers() -> int:
+    # OCR calls are network / disk bound, so oversubscribe the CPUs.
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
 def _write_jsonl(records: List[Dict[str, Any]], out_path: Path) -> None:
     """
     Write a list of dict records to disk as JSON Lines (JSONL).
 
-    Each record is written as one JSON object per line.
+    Each record is written as one JSON object per line. Records are
+    serialized up front and written with a single call.
     """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as f:
-        for rec in records:
-            json.dump(rec, f, ensure_ascii=False)
-            f.write("\n")
+    payload = b"".join([json_dumps(rec) + b"\n" for rec in records])
+    with out_path.open("wb") as f:
+        f.write(payload)
     logger.info("Wrote %d records to %s", len(records), out_path)
 
 
+def _jsonl_sink(out_path: Path) -> BinaryIO:
+    """
+    Open `out_path` for streaming JSONL output (one record per write).
+
+    The caller is responsible for closing the returned file.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    return out_path.open("wb")
+
+
+def _write_parquet(records: List[Dict[str, Any]], out_path: Path) -> None:
+    """
+    Write records as a zstd-compressed Parquet file (requires pyarrow).
+
+    Any existing file is removed first so a failed or skipped write never
+    leaves a stale Parquet export for build_duckdb() to pick up.
+    """
+    out_path.unlink(missing_ok=True)
+    if pyarrow is None or not records:
+        return
+
+    try:
+        pd.DataFrame.from_records(records).to_parquet(
+            out_path, compression="zstd", index=False
+        )
+        logger.info("Wrote %d records to %s", len(records), out_path)
+    except Exception as e:
+        out_path.unlink(missing_ok=True)
+        logger.warning("Failed to write Parquet export %s: %s", out_path, e)
+
+
 def _validate_manifest(manifest_df: pd.DataFrame) -> None:
     """
     Validate that the manifest contains the core columns expected by the pipeline.
@@ -161,6 +287,15 @@ def _validate_manifest(manifest_df: pd.DataFrame) -> None:
         )
 
 
+def _nonempty_str(value: Any) -> Optional[str]:
+    """`value` stripped, if it is a non-blank string; otherwise None."""
+    if type(value) is str:
+        value = value.strip()
+        if value:
+            return value
+    return None
+
+
 def _build_search_text(enriched: PageRecord) -> str:
     """
     Construct a canonical `search_text` field for a page.
@@ -170,99 +305,30 @@ def _build_search_text(enriched: PageRecord) -> str:
         2. notes (from manifest)
         3. OCR text (ocr_text → clean_text → raw_text)
     """
-    pieces: List[str] = []
-
-    if isinstance(enriched.get("search_text"), str) and enriched["search_text"].strip():
-        pieces.append(enriched["search_text"].strip())
-
-    notes = enriched.get("notes")
-    if isinstance(notes, str) and notes.strip():
-        pieces.append(notes.strip())
-
-    ocr_text = (
+    candidates = (
+        enriched.get("search_text"),
+        enriched.get("notes"),
         enriched.get("ocr_text")
         or enriched.get("clean_text")
-        or enriched.get("raw_text")
+        or enriched.get("raw_text"),
+    )
+    return "\n\n".join(
+        [piece for piece in map(_nonempty_str, candidates) if piece is not None]
     )
-
-    if isinstance(ocr_text, str) and ocr_text.strip():
-        pieces.append(ocr_text.strip())
-
-    return "\n\n".join(pieces).strip()
 
 
-# ---------------------------------------------------------------------
-# Main pipeline
-# ---------------------------------------------------------------------
-def run_pipeline(
-    manifest_df: pd.DataFrame,
-    ocr_agent: OCRAgent,
-    threading_agent: ThreadingAgent,
-    extraction_agent: ExtractionAgent,
-    epstein_image_root: Path,
-    *,
-    ocr_cache_dir: Optional[Path] = None,
-    use_ocr_cache: bool = True,
-    save_ocr_cache: bool = True,
-    export_dir: Optional[Path] = None,
-    export_jsonl: bool = True,
-) -> Tuple[List[PageRecord], List[SequenceRecord]]:
+def _begin_run(manifest_df: pd.DataFrame, epstein_image_root: Path) -> bool:
     """
-    Run the Project LANTERN demo pipeline over a manifest-driven dataset.
-
-    Parameters
-    ----------
-    manifest_df :
-        DataFrame containing manifest rows with at least:
-        - file_path (relative to epstein_image_root)
-        - category
-        - doc_type
-        - sequence_id (optional)
-        - sequence_order (optional)
-
-    ocr_agent :
-        Initialized OCR agent.
-
-    threading_agent :
-        Initialized Thread Reconstruction agent.
-
-    extraction_agent :
-        Initialized Extraction & Insights agent.
-
-    epstein_image_root :
-        Root directory where the curated Epstein images live, e.g.
-        PROJECT_ROOT / "data" / "epstein_curated_v1".
+    Validate pipeline inputs and log the start of a run.
 
-    ocr_cache_dir :
-        Optional directory to store and read OCR results (per-page JSON).
-
-    use_ocr_cache :
-        Whether to read existing OCR records from `ocr_cache_dir`.
-
-    save_ocr_cache :
-        Whether to save new OCR records into `ocr_cache_dir`.
-
-    export_dir :
-        Optional directory where page- and sequence-level outputs
-        will be written as JSONL files (pages.jsonl, sequences.jsonl).
-
-    export_jsonl :
-        Whether to write JSONL exports when `export_dir` is provided.
-
-    Returns
-    -------
-    (enriched_pages, sequence_summaries) :
-        enriched_pages
-            List of page-level enriched records.
-        sequence_summaries
-            List of sequence-level summary records.
+    Returns False (after logging a warning) for an empty manifest.
     """
     if manifest_df.empty:
         logger.warning(
             "run_pipeline called with an empty manifest_df; "
             "no OCR or extraction will be performed."
         )
-        return [], []
+        return False
 
     _validate_manifest(manifest_df)
 
@@ -276,71 +342,115 @@ def run_pipeline(
         len(manifest_df),
     )
 
-    # ------------------------------------------------------------------
-    # 1) OCR each image in the manifest (with optional cache)
-    # ------------------------------------------------------------------
-    ocr_outputs: Dict[str, PageRecord] = {}
+    return True
+
+
+def _resolve_cached_ocr(
+    manifest_df: pd.DataFrame,
+    manifest_rows: List[PageRecord],
+    epstein_image_root: Path,
+    ocr_cache_dir: Optional[Path],
+    use_ocr_cache: bool,
+) -> Tuple[
+    List[Optional[PageRecord]],
+    Dict[str, List[int]],
+    List[Tuple[str, Path, PageRecord, Optional[str]]],
+    int,
+]:
+    """
+    Resolve OCR cache hits for the manifest.
+
+    Returns
+    -------
+    (ocr_records, slots, misses, num_from_cache) :
+        ocr_records is aligned with `manifest_rows` and holds the cached
+        OCR record of each row (None where OCR is still needed); slots maps
+        each rel_path to its row indices; misses lists the
+        (rel_path, full_image_path, row, image_digest) pages that still need
+        OCR. Each image is listed once: rows whose path or image content
+        repeats an earlier miss are added to that miss's slots.
+    """
+    file_paths = manifest_df["file_path"].to_numpy()
 
+    slots: Dict[str, List[int]] = {}
+    for i, file_path in enumerate(file_paths):
+        slots.setdefault(str(file_path), []).append(i)
+
+    ocr_records: List[Optional[PageRecord]] = [None] * len(manifest_rows)
+    misses: List[Tuple[str, Path, PageRecord, Optional[str]]] = []
+    miss_by_digest: Dict[str, str] = {}
     num_from_cache = 0
-    num_fresh_ocr = 0
 
-    for idx, (_, row) in enumerate(manifest_df.iterrows(), start=1):
-        rel_path = str(row["file_path"])
+    for rel_path, idxs in list(slots.items()):
         full_image_path = epstein_image_root / rel_path
+        image_digest = _image_digest(full_image_path) if ocr_cache_dir is not None else None
 
         logger.debug(
             "OCR [%d/%d] → %s",
-            idx,
-            len(manifest_df),
+            idxs[0] + 1,
+            len(manifest_rows),
             full_image_path,
         )
 
-        ocr_record: Optional[PageRecord] = None
-
-        # 1a. Try cache (if enabled), but ignore "bad" cached records
+        # Try cache (if enabled), but ignore "bad" cached records
         if ocr_cache_dir is not None and use_ocr_cache:
-            cached = _load_ocr_from_cache(ocr_cache_dir, rel_path)
+            cached = _load_ocr_from_cache(ocr_cache_dir, rel_path, image_digest)
             if cached is not None:
-                # Consider cached OCR "bad" if it has an error AND no usable text
-                has_text = any(
-                    isinstance(cached.get(k), str) and cached[k].strip()
-                    for k in ("clean_text", "raw_text", "ocr_text")
-                )
-                if cached.get("error") and not has_text:
-                    logger.info(
-                        "Ignoring cached OCR with error and no text for %s; re-running OCR.",
-                        rel_path,
-                    )
-                    ocr_record = None
-                else:
-                    ocr_record = cached
+                if _usable_cached_record(cached):
+                    for i in idxs:
+                        ocr_records[i] = cached
                     num_from_cache += 1
-            else:
-                ocr_record = None
+                    continue
+                logger.info(
+                    "Ignoring cached OCR with no text for %s; re-running OCR.",
+                    rel_path,
+                )
+
+        if image_digest is not None and image_digest in miss_by_digest:
+            # Same bytes as an image already queued: share its OCR result
+            slots[miss_by_digest[image_digest]].extend(idxs)
+            continue
+        if image_digest is not None:
+            miss_by_digest[image_digest] = rel_path
 
-        # 1b. If cache miss or bad cache, call OCR agent
-        if ocr_record is None:
-            ocr_record = ocr_agent.run_page(str(full_image_path), page_meta=row.to_dict())
-            num_fresh_ocr += 1
+        misses.append((rel_path, full_image_path, manifest_rows[idxs[0]], image_digest))
 
-            if ocr_cache_dir is not None and save_ocr_cache and ocr_record is not None:
-                _save_ocr_to_cache(ocr_cache_dir, rel_path, ocr_record)
+    return ocr_records, slots, misses, num_from_cache
 
-        ocr_outputs[rel_path] = ocr_record or {}
 
+def _log_ocr_done(num_images: int, num_from_cache: int, num_fresh_ocr: int) -> None:
     logger.info(
         "OCR completed for %d images (%d from cache, %d fresh).",
-        len(ocr_outputs),
+        num_images,
         num_from_cache,
         num_fresh_ocr,
     )
 
+
+def _enrich_and_summarize(
+    manifest_df: pd.DataFrame,
+    manifest_rows: List[PageRecord],
+    ocr_records: List[Optional[PageRecord]],
+    threading_agent: ThreadingAgent,
+    extraction_agent: ExtractionAgent,
+    *,
+    export_dir: Optional[Path],
+    export_jsonl: bool,
+    export_parquet: bool,
+    extraction_batch_size: int,
+) -> Tuple[List[PageRecord], List[SequenceRecord]]:
+    """Steps 2-5 of the pipeline, shared by run_pipeline() and run_pipeline_async()."""
     # ------------------------------------------------------------------
     # 2) Group rows into sequences via ThreadingAgent
     # ------------------------------------------------------------------
-    manifest_rows: List[PageRecord] = manifest_df.to_dict(orient="records")
-
-    sequences_map = threading_agent.group_sequences(manifest_rows)
+    # The manifest is already columnar; group it without going through rows
+    # (as one Arrow table when pyarrow is installed, else with pandas).
+    if pyarrow is not None and hasattr(threading_agent, "group_sequences_arrow"):
+        sequences_map = threading_agent.group_sequences_arrow(
+            threading_agent.from_frame(manifest_df)
+        )
+    else:
+        sequences_map = threading_agent.group_sequences_df(manifest_df)
     # Expecting a mapping: sequence_id -> list[manifest_row_dict]
     if not isinstance(sequences_map, dict):
         raise TypeError(
@@ -360,71 +470,102 @@ def run_pipeline(
     # ------------------------------------------------------------------
     enriched_pages: List[PageRecord] = []
 
-    for row in manifest_rows:
-        rel_path = str(row.get("file_path"))
-        ocr_record = ocr_outputs.get(rel_path, {}) or {}
-
-        clean_text = (
-            ocr_record.get("clean_text")
-            or ocr_record.get("raw_text")
-            or ""
-        )
-
-        ext_result = extraction_agent.extract_page(
-            clean_text=clean_text,
-            metadata=row,
-        )
-
-        enriched = {
-            **row,
-            **ocr_record,
-            **ext_result,
-        }
-
-        # Ensure stable keys
-        enriched.setdefault("file_path", rel_path)
-        enriched.setdefault("sequence_id", row.get("sequence_id"))
-        enriched.setdefault("sequence_order", row.get("sequence_order"))
-        enriched.setdefault("ocr_text", enriched.get("ocr_text") or clean_text)
-        enriched.setdefault(
-            "ocr_text_length",
-            len(enriched.get("ocr_text", "") or ""),
-        )
+    # Slot of every page within its sequence, so sequence texts are
+    # collected (in sequence order) during this single enrichment pass.
+    seq_texts: Dict[Any, List[str]] = {}
+    seq_slots: Dict[str, List[Tuple[Any, int]]] = {}
+    for seq_id, rows in sequences_map.items():
+        seq_texts[seq_id] = [""] * len(rows)
+        for i, r in enumerate(rows):
+            seq_slots.setdefault(str(r.get("file_path")), []).append((seq_id, i))
 
-        # Alias page_summary → summary for legacy notebook cells
-        if "page_summary" in enriched and "summary" not in enriched:
-            enriched["summary"] = enriched["page_summary"]
+    exporting = export_dir is not None and export_jsonl
+    if exporting:
+        export_dir = Path(export_dir)
+        pages_path = export_dir / "pages.jsonl"
+        # Pages are streamed to disk as they are enriched rather than
+        # serialized in one go at the end.
+        pages_sink: Optional[BinaryIO] = _jsonl_sink(pages_path)
+    else:
+        pages_sink = None
 
-        # Canonical search_text
-        enriched["search_text"] = _build_search_text(enriched)
+    try:
+        size = max(1, extraction_batch_size)
+        for start in range(0, len(manifest_rows), size):
+            batch_rows = manifest_rows[start : start + size]
+            batch_ocr: List[PageRecord] = []
+            batch: List[Dict[str, Any]] = []
+            for row, ocr_record in zip(batch_rows, ocr_records[start : start + size]):
+                ocr_record = ocr_record or {}
+                clean_text = (
+                    ocr_record.get("clean_text")
+                    or ocr_record.get("raw_text")
+                    or ""
+                )
+                batch_ocr.append(ocr_record)
+                batch.append({"clean_text": clean_text, "metadata": row})
+
+            # One extraction call per batch of pages
+            ext_results = extraction_agent.extract_pages(batch)
+
+            for row, ocr_record, item, ext_result in zip(
+                batch_rows, batch_ocr, batch, ext_results
+            ):
+                clean_text = item["clean_text"]
+                rel_path = str(row.get("file_path"))
+
+                # Grow one dict in place rather than merging into copies
+                enriched = dict(row)
+                enriched.update(ocr_record)
+                enriched.update(ext_result)
+
+                # Ensure stable keys
+                if "file_path" not in enriched:
+                    enriched["file_path"] = rel_path
+                if "sequence_id" not in enriched:
+                    enriched["sequence_id"] = row.get("sequence_id")
+                if "sequence_order" not in enriched:
+                    enriched["sequence_order"] = row.get("sequence_order")
+                if "ocr_text" not in enriched:
+                    enriched["ocr_text"] = clean_text
+                if "ocr_text_length" not in enriched:
+                    enriched["ocr_text_length"] = len(enriched["ocr_text"] or "")
+
+                # Alias page_summary → summary for legacy notebook cells
+                if "page_summary" in enriched and "summary" not in enriched:
+                    enriched["summary"] = enriched["page_summary"]
+
+                # Canonical search_text
+                enriched["search_text"] = _build_search_text(enriched)
+
+                enriched_pages.append(enriched)
+
+                slots = seq_slots.get(str(enriched.get("file_path")))
+                if slots:
+                    page_text = str(
+                        enriched.get("clean_text")
+                        or enriched.get("ocr_text")
+                        or enriched.get("raw_text")
+                        or ""
+                    )
+                    for seq_id, i in slots:
+                        seq_texts[seq_id][i] = page_text
+                if pages_sink is not None:
+                    pages_sink.write(json_dumps(enriched) + b"\n")
+    finally:
+        if pages_sink is not None:
+            pages_sink.close()
 
-        enriched_pages.append(enriched)
+    if exporting:
+        logger.info("Wrote %d records to %s", len(enriched_pages), pages_path)
 
     # ------------------------------------------------------------------
     # 4) Sequence-level summaries via ExtractionAgent
     # ------------------------------------------------------------------
     sequence_summaries: List[SequenceRecord] = []
 
-    # Build quick lookup by file_path for sequence assembly (optional)
-    pages_by_file: Dict[str, PageRecord] = {
-        str(p.get("file_path")): p for p in enriched_pages
-    }
-
     for seq_id, rows in sequences_map.items():
-        texts: List[str] = []
-        for r in rows:
-            fp = str(r.get("file_path"))
-            page = pages_by_file.get(fp)
-            if not page:
-                continue
-            ct = (
-                page.get("clean_text")
-                or page.get("ocr_text")
-                or page.get("raw_text")
-                or ""
-            )
-            if ct:
-                texts.append(str(ct))
+        texts = [t for t in seq_texts[seq_id] if t]
 
         if not texts:
             seq_meta = {"sequence_summary": "", "sequence_search_text": ""}
@@ -452,12 +593,222 @@ def run_pipeline(
     # ------------------------------------------------------------------
     # 5) Optional JSONL export for search / analytics layers
     # ------------------------------------------------------------------
-    if export_dir is not None and export_jsonl:
-        export_dir = Path(export_dir)
-        pages_path = export_dir / "pages.jsonl"
-        seqs_path = export_dir / "sequences.jsonl"
+    # (pages.jsonl was already streamed out in step 3)
+    if exporting:
+        _write_jsonl(sequence_summaries, export_dir / "sequences.jsonl")
 
-        _write_jsonl(enriched_pages, pages_path)
-        _write_jsonl(sequence_summaries, seqs_path)
+    # Columnar copies for the search layer (written after the JSONL files,
+    # so build_duckdb() sees them as current)
+    if export_dir is not None and export_parquet:
+        export_dir = Path(export_dir)
+        _write_parquet(enriched_pages, export_dir / "pages.parquet")
+        _write_parquet(sequence_summaries, export_dir / "sequences.parquet")
 
     return enriched_pages, sequence_summaries
+
+
+# ---------------------------------------------------------------------
+# Main pipeline
+# ---------------------------------------------------------------------
+def run_pipeline(
+    manifest_df: pd.DataFrame,
+    ocr_agent: OCRAgent,
+    threading_agent: ThreadingAgent,
+    extraction_agent: ExtractionAgent,
+    epstein_image_root: Path,
+    *,
+    ocr_cache_dir: Optional[Path] = None,
+    use_ocr_cache: bool = True,
+    save_ocr_cache: bool = True,
+    export_dir: Optional[Path] = None,
+    export_jsonl: bool = True,
+    export_parquet: bool = False,
+    ocr_workers: Optional[int] = None,
+    extraction_batch_size: int = 8,
+) -> Tuple[List[PageRecord], List[SequenceRecord]]:
+    """
+    Run the Project LANTERN demo pipeline over a manifest-driven dataset.
+
+    Parameters
+    ----------
+    manifest_df :
+        DataFrame containing manifest rows with at least:
+        - file_path (relative to epstein_image_root)
+        - category
+        - doc_type
+        - sequence_id (optional)
+        - sequence_order (optional)
+
+    ocr_agent :
+        Initialized OCR agent.
+
+    threading_agent :
+        Initialized Thread Reconstruction agent.
+
+    extraction_agent :
+        Initialized Extraction & Insights agent.
+
+    epstein_image_root :
+        Root directory where the curated Epstein images live, e.g.
+        PROJECT_ROOT / "data" / "epstein_curated_v1".
+
+    ocr_cache_dir :
+        Optional directory to store and read OCR results (per-page JSON).
+
+    use_ocr_cache :
+        Whether to read existing OCR records from `ocr_cache_dir`.
+
+    save_ocr_cache :
+        Whether to save new OCR records into `ocr_cache_dir`.
+
+    export_dir :
+        Optional directory where page- and sequence-level outputs
+        will be written as JSONL files (pages.jsonl, sequences.jsonl).
+
+    export_jsonl :
+        Whether to write JSONL exports when `export_dir` is provided.
+
+    export_parquet :
+        Opt-in: also write pages.parquet / sequences.parquet (zstd) when
+        `export_dir` is provided and pyarrow is installed. Once present,
+        build_duckdb() ingests these instead of the JSONL files whenever
+        they are not older than them.
+
+    ocr_workers :
+        Number of threads used to OCR pages that are not in the cache.
+        Defaults to min(32, 4 * CPU count); 1 runs OCR serially.
+
+    extraction_batch_size :
+        Number of pages handed to ExtractionAgent.extract_pages() per call
+        (packed into one LLM request when a model is configured).
+
+    Returns
+    -------
+    (enriched_pages, sequence_summaries) :
+        enriched_pages
+            List of page-level enriched records.
+        sequence_summaries
+            List of sequence-level summary records.
+    """
+    if not _begin_run(manifest_df, epstein_image_root):
+        return [], []
+
+    # ------------------------------------------------------------------
+    # 1) OCR each image in the manifest (with optional cache)
+    # ------------------------------------------------------------------
+    # Materialize rows once; they are reused for OCR metadata and enrichment.
+    manifest_rows: List[PageRecord] = manifest_df.to_dict(orient="records")
+
+    ocr_records, slots, misses, num_from_cache = _resolve_cached_ocr(
+        manifest_df, manifest_rows, epstein_image_root, ocr_cache_dir, use_ocr_cache
+    )
+
+    # OCR cache misses concurrently; cache writes stay on this thread
+    if misses:
+        workers = ocr_workers or _default_ocr_workers()
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(misses)))) as ex:
+            futures = {
+                ex.submit(ocr_agent.run_page, str(full_path), page_meta=row_dict): (
+                    rel_path,
+                    image_digest,
+                )
+                for rel_path, full_path, row_dict, image_digest in misses
+            }
+            for fut in as_completed(futures):
+                rel_path, image_digest = futures[fut]
+                ocr_record = fut.result()
+
+                if ocr_cache_dir is not None and save_ocr_cache and ocr_record is not None:
+                    _save_ocr_to_cache(ocr_cache_dir, rel_path, ocr_record, image_digest)
+
+                for i in slots[rel_path]:
+                    ocr_records[i] = ocr_record or {}
+
+    _log_ocr_done(len(slots), num_from_cache, len(misses))
+
+    return _enrich_and_summarize(
+        manifest_df,
+        manifest_rows,
+        ocr_records,
+        threading_agent,
+        extraction_agent,
+        export_dir=export_dir,
+        export_jsonl=export_jsonl,
+        export_parquet=export_parquet,
+        extraction_batch_size=extraction_batch_size,
+    )
+
+
+async def run_pipeline_async(
+    manifest_df: pd.DataFrame,
+    ocr_agent: OCRAgent,
+    threading_agent: ThreadingAgent,
+    extraction_agent: ExtractionAgent,
+    epstein_image_root: Path,
+    *,
+    ocr_cache_dir: Optional[Path] = None,
+    use_ocr_cache: bool = True,
+    save_ocr_cache: bool = True,
+    export_dir: Optional[Path] = None,
+    export_jsonl: bool = True,
+    export_parquet: bool = False,
+    ocr_concurrency: int = 16,
+    extraction_batch_size: int = 8,
+) -> Tuple[List[PageRecord], List[SequenceRecord]]:
+    """
+    Async variant of run_pipeline().
+
+    Cache misses are OCR'd on the event loop via `ocr_agent.run_page_async`
+    (or `run_page` in a worker thread for agents without one), with at most
+    `ocr_concurrency` pages in flight. Cache writes run in worker threads so
+    they overlap in-flight OCR. All other parameters and the return value
+    are the same as for run_pipeline().
+    """
+    if not _begin_run(manifest_df, epstein_image_root):
+        return [], []
+
+    manifest_rows: List[PageRecord] = manifest_df.to_dict(orient="records")
+
+    ocr_records, slots, misses, num_from_cache = _resolve_cached_ocr(
+        manifest_df, manifest_rows, epstein_image_root, ocr_cache_dir, use_ocr_cache
+    )
+
+    sem = asyncio.Semaphore(max(1, ocr_concurrency))
+    run_page_async = getattr(ocr_agent, "run_page_async", None)
+
+    async def _one(
+        rel_path: str, full_path: Path, row: PageRecord, image_digest: Optional[str]
+    ) -> Tuple[str, PageRecord]:
+        async with sem:
+            if run_page_async is not None:
+                ocr_record = await run_page_async(str(full_path), page_meta=row)
+            else:
+                ocr_record = await asyncio.to_thread(
+                    ocr_agent.run_page, str(full_path), page_meta=row
+                )
+
+        if ocr_cache_dir is not None and save_ocr_cache and ocr_record is not None:
+            await asyncio.to_thread(
+                _save_ocr_to_cache, ocr_cache_dir, rel_path, ocr_record, image_digest
+            )
+        return rel_path, ocr_record
+
+    for rel_path, ocr_record in await asyncio.gather(*(_one(*m) for m in misses)):
+        for i in slots[rel_path]:
+            ocr_records[i] = ocr_record or {}
+
+    _log_ocr_done(len(slots), num_from_cache, len(misses))
+
+    # Extraction / export are synchronous; keep them off the event loop
+    return await asyncio.to_thread(
+        _enrich_and_summarize,
+        manifest_df,
+        manifest_rows,
+        ocr_records,
+        threading_agent,
+        extraction_agent,
+        export_dir=export_dir,
+        export_jsonl=export_jsonl,
+        export_parquet=export_parquet,
+        extraction_batch_size=extraction_batch_size,
+    )
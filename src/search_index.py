@@ -35,18 +35,30 @@ build_duckdb(
 
 con = open_duckdb(DB_PATH)
 con.sql("SELECT * FROM pages LIMIT 5").df()
+
+# Ranked keyword search: build with fts=True once the DuckDB fts extension
+# is installed (INSTALL fts; needs network access the first time)
+con.sql(
+    "SELECT file_path, fts_main_pages.match_bm25(file_path, 'flight log') AS score "
+    "FROM pages WHERE score IS NOT NULL ORDER BY score DESC"
+).df()
 """
 
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import json
+import logging
 
 import duckdb
 import pandas as pd
 
+from tools.ocr_tools import json_loads
+
+logger = logging.getLogger(__name__)
+
 PageRecord = Dict[str, Any]
 SequenceRecord = Dict[str, Any]
 
@@ -67,13 +79,13 @@ def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
         return []
 
     records: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
+    with path.open("rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                records.append(json.loads(line))
+                records.append(json_loads(line))
             except json.JSONDecodeError as e:
                 print(f"⚠️ Skipping malformed JSON line in {path}: {e}")
     return records
@@ -105,7 +117,14 @@ def _build_page_dataframe(pages: List[PageRecord]) -> pd.DataFrame:
     if not pages:
         return pd.DataFrame()
 
-    df = pd.json_normalize(pages)
+    df = pd.DataFrame.from_records(pages)
+
+    # If summary is missing but page_summary exists, align the naming
+    # (before the defaults below, which would otherwise mask either one)
+    if "summary" not in df.columns and "page_summary" in df.columns:
+        df["summary"] = df["page_summary"]
+    elif "summary" in df.columns and "page_summary" not in df.columns:
+        df["page_summary"] = df["summary"]
 
     # Ensure core fields exist, even if missing in some records
     for col, default in [
@@ -113,7 +132,7 @@ def _build_page_dataframe(pages: List[PageRecord]) -> pd.DataFrame:
         ("category", None),
         ("doc_type", None),
         ("sequence_id", None),
-        ("sequence_order", None),
+        ("sequence_order", float("nan")),
         ("summary", None),
         ("page_summary", None),
         ("ocr_text", None),
@@ -121,50 +140,19 @@ def _build_page_dataframe(pages: List[PageRecord]) -> pd.DataFrame:
         if col not in df.columns:
             df[col] = default
 
-    # If summary is missing but page_summary exists, align the naming
-    if "summary" not in df.columns and "page_summary" in df.columns:
-        df["summary"] = df["page_summary"]
-    elif "summary" in df.columns and "page_summary" not in df.columns:
-        df["page_summary"] = df["summary"]
-
-    def make_search_text(row: pd.Series) -> str:
-        """
-        Derive a basic search_text field that concatenates summary,
-        OCR text, and any entity names (if available).
-        """
-        parts: List[str] = []
-
-        summary = row.get("summary")
-        if isinstance(summary, str):
-            parts.append(summary)
-
-        ocr_text = row.get("ocr_text")
-        if isinstance(ocr_text, str):
-            parts.append(ocr_text)
-
-        # entities is often a list of dicts with 'text' or 'name'
-        entities = row.get("entities")
-        if isinstance(entities, list):
-            names: List[str] = []
-            for ent in entities:
-                if isinstance(ent, dict):
-                    name = (
-                        ent.get("text")
-                        or ent.get("name")
-                        or ent.get("value")
-                    )
-                    if isinstance(name, str):
-                        names.append(name)
-                elif isinstance(ent, str):
-                    names.append(ent)
-            if names:
-                parts.append(" ".join(names))
-
-        return " ".join(parts)
-
-    # Use existing search_text if present; otherwise derive one.
+    # Use existing search_text if present; otherwise derive one by
+    # concatenating summary, OCR text, and any entity names (if available).
     if "search_text" not in df.columns:
-        df["search_text"] = df.apply(make_search_text, axis=1)
+        columns = [
+            df["summary"].tolist(),
+            df["ocr_text"].tolist(),
+            df["entities"].map(_entity_names).tolist() if "entities" in df.columns else None,
+        ]
+        # Only string values contribute (NaN / numbers / None are skipped)
+        df["search_text"] = [
+            " ".join(p for p in row if isinstance(p, str))
+            for row in zip(*(c for c in columns if c is not None))
+        ]
 
     # A simple boolean convenience flag for downstream filters
     df["has_text"] = df["search_text"].fillna("").str.len() > 0
@@ -172,11 +160,48 @@ def _build_page_dataframe(pages: List[PageRecord]) -> pd.DataFrame:
     # Normalize common identifier columns for friendlier querying
     if "sequence_id" in df.columns:
         # Keep as string for consistent joins and WHERE filters
-        df["sequence_id"] = df["sequence_id"].astype(str)
+        df["sequence_id"] = _str_or_null(df["sequence_id"])
 
     return df
 
 
+def _str_or_null(values: pd.Series) -> pd.Series:
+    """
+    str() of every non-missing value; None / NaN stay null. Same result
+    on every pandas version (astype(str) gives "None" / "nan" before
+    pandas 3) and the same as the VARCHAR cast on the native path.
+    Integral floats print as ints: from_records() turns an int column
+    with gaps into float64, which would otherwise give "1.0".
+    """
+
+    def _to_str(v: Any) -> Optional[str]:
+        if v is None or (isinstance(v, float) and v != v):
+            return None
+        if isinstance(v, float) and v.is_integer():
+            return str(int(v))
+        return str(v)
+
+    return pd.Series([_to_str(v) for v in values], index=values.index, dtype=object)
+
+
+def _entity_names(entities: Any) -> Optional[str]:
+    """
+    Space-joined entity names; entities is often a list of dicts with
+    'text' or 'name'. Returns None when there are no names.
+    """
+    if not isinstance(entities, list):
+        return None
+    names: List[str] = []
+    for ent in entities:
+        if isinstance(ent, dict):
+            name = ent.get("text") or ent.get("name") or ent.get("value")
+            if isinstance(name, str):
+                names.append(name)
+        elif isinstance(ent, str):
+            names.append(ent)
+    return " ".join(names) if names else None
+
+
 # ---------------------------------------------------------------------------
 # Sequence-level normalization
 # ---------------------------------------------------------------------------
@@ -196,7 +221,7 @@ def _build_sequence_dataframe(seqs: List[SequenceRecord]) -> pd.DataFrame:
     if not seqs:
         return pd.DataFrame()
 
-    df = pd.json_normalize(seqs)
+    df = pd.DataFrame.from_records(seqs)
 
     # If the ExtractionAgent used `summary` instead of `overall_summary`,
     # align the naming for the database.
@@ -213,14 +238,198 @@ def _build_sequence_dataframe(seqs: List[SequenceRecord]) -> pd.DataFrame:
         ("overall_summary", None),
     ]:
         if col not in df.columns:
-            df[col] = default
+            # List defaults need one (fresh) list per row
+            df[col] = [list(default) for _ in range(len(df))] if isinstance(default, list) else default
 
     # Normalize identifier type
-    df["sequence_id"] = df["sequence_id"].astype(str)
+    df["sequence_id"] = _str_or_null(df["sequence_id"])
 
     return df
 
 
+# ---------------------------------------------------------------------------
+# Native DuckDB ingest
+# ---------------------------------------------------------------------------
+
+# Core page columns and the type of their NULL default when absent
+_PAGE_CORE_COLUMNS = {
+    "file_path": "VARCHAR",
+    "category": "VARCHAR",
+    "doc_type": "VARCHAR",
+    "sequence_id": "VARCHAR",
+    "sequence_order": "DOUBLE",
+    "summary": "VARCHAR",
+    "page_summary": "VARCHAR",
+    "ocr_text": "VARCHAR",
+}
+
+_READ_JSONL = "read_json_auto(?, format='newline_delimited')"
+_READ_PARQUET = "read_parquet(?)"
+
+
+def _native_source(path: Path) -> Tuple[Path, str]:
+    """
+    File and DuckDB reader for an export: the Parquet sibling of `path`
+    (pages.jsonl -> pages.parquet) when it exists and is not older than
+    the JSONL file, else `path` itself.
+    """
+    parquet = path.with_suffix(".parquet")
+    if parquet.exists() and (
+        not path.exists() or parquet.stat().st_mtime >= path.stat().st_mtime
+    ):
+        return parquet, _READ_PARQUET
+    return path, _READ_JSONL
+
+
+def _source_columns(con: duckdb.DuckDBPyConnection, reader: str, path: Path) -> Dict[str, str]:
+    rel = con.execute(f"SELECT * FROM {reader} LIMIT 0", [str(path)])
+    return {d[0]: str(d[1]) for d in rel.description}
+
+
+def _varchar_sql(col: str, cols: Dict[str, str]) -> str:
+    """
+    `col` as VARCHAR, like _str_or_null(). read_json_auto types a column
+    holding mixed values (1 and "a") as JSON, where a plain CAST would
+    keep the quotes around strings.
+    """
+    if cols[col] == "JSON":
+        return f"json_extract_string({col}, '$') AS {col}"
+    return f"CAST({col} AS VARCHAR) AS {col}"
+
+
+def _page_select_sql(cols: Dict[str, str]) -> Optional[str]:
+    """
+    SELECT list equivalent to _build_page_dataframe(), or None when the
+    SQL path can't reproduce it (search_text must be derived in Python).
+    """
+    if "search_text" not in cols:
+        return None
+
+    replace = [_varchar_sql("sequence_id", cols)] if "sequence_id" in cols else []
+    select = "* EXCLUDE (has_text)" if "has_text" in cols else "*"
+    if replace:
+        select += f" REPLACE ({', '.join(replace)})"
+
+    # summary / page_summary alias each other when only one is present
+    aliases = {"summary": "page_summary", "page_summary": "summary"}
+    extras = []
+    for c, col_type in _PAGE_CORE_COLUMNS.items():
+        if c in cols:
+            continue
+        if aliases.get(c) in cols:
+            extras.append(f"{aliases[c]} AS {c}")
+        else:
+            extras.append(f"CAST(NULL AS {col_type}) AS {c}")
+    extras.append("length(coalesce(search_text, '')) > 0 AS has_text")
+    return ", ".join([select, *extras])
+
+
+def _sequence_select_sql(cols: Dict[str, str]) -> Optional[str]:
+    """SELECT list equivalent to _build_sequence_dataframe()."""
+    extras: List[str] = []
+    if "overall_summary" not in cols:
+        extras.append(
+            ("summary" if "summary" in cols else "CAST(NULL AS VARCHAR)") + " AS overall_summary"
+        )
+    elif "summary" not in cols:
+        extras.append("overall_summary AS summary")
+
+    for col, default in [
+        ("sequence_id", "CAST(NULL AS VARCHAR)"),
+        ("num_pages", "0"),
+        ("categories_present", "CAST([] AS VARCHAR[])"),
+        ("doc_types_present", "CAST([] AS VARCHAR[])"),
+    ]:
+        if col not in cols:
+            extras.append(f"{default} AS {col}")
+
+    select = "*"
+    if "sequence_id" in cols:
+        select += f" REPLACE ({_varchar_sql('sequence_id', cols)})"
+    return ", ".join([select, *extras])
+
+
+def _create_table(
+    con: duckdb.DuckDBPyConnection,
+    table: str,
+    path: Path,
+    select_sql: Callable[[Dict[str, str]], Optional[str]],
+    build_df: Callable[[List[Dict[str, Any]]], pd.DataFrame],
+) -> int:
+    """
+    Create `table` from a JSONL export and return its row count.
+
+    DuckDB reads the file directly where possible (preferring a Parquet
+    copy of the export), avoiding the Python list + DataFrame copies;
+    otherwise (missing / empty / irregular file) it falls back to loading
+    the JSONL records through pandas.
+    """
+    source, reader = _native_source(path)
+    if source.exists():
+        try:
+            select = select_sql(_source_columns(con, reader, source))
+            if select is not None:
+                con.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} AS SELECT {select} FROM {reader}",
+                    [str(source)],
+                )
+                return con.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+        except duckdb.Error as e:
+            logger.warning(
+                "Native DuckDB ingest of %s failed, loading it through pandas: %s",
+                source,
+                e,
+            )
+
+    df = build_df(_load_jsonl(path))
+    view = f"{table}_df"
+    con.register(view, df)
+    con.execute(f"CREATE TABLE IF NOT EXISTS {table} AS SELECT * FROM {view};")
+    con.unregister(view)
+    return len(df)
+
+
+# ---------------------------------------------------------------------------
+# Column types / indexes
+# ---------------------------------------------------------------------------
+
+# Identifier columns kept as VARCHAR for consistent joins and WHERE filters
+_PAGE_VARCHAR_COLUMNS = ("file_path", "category", "doc_type", "sequence_id")
+
+
+def _table_columns(con: duckdb.DuckDBPyConnection, table: str) -> Dict[str, str]:
+    return {name: col_type for name, col_type, *_ in con.execute(f"DESCRIBE {table}").fetchall()}
+
+
+def _finalize_pages_table(con: duckdb.DuckDBPyConnection, *, fts: bool) -> None:
+    """
+    Pin identifier column types and build lookup / full-text indexes on
+    `pages`. The FTS index needs DuckDB's `fts` extension to be installed
+    already (it is only LOADed here, never downloaded); if it can't be
+    loaded, search falls back to scans.
+    """
+    columns = _table_columns(con, "pages")
+
+    for col in _PAGE_VARCHAR_COLUMNS:
+        if col in columns and columns[col] != "VARCHAR":
+            con.execute(f"ALTER TABLE pages ALTER {col} TYPE VARCHAR;")
+
+    if "sequence_id" in columns:
+        con.execute("CREATE INDEX IF NOT EXISTS idx_pages_seq ON pages(sequence_id);")
+
+    if not fts or "file_path" not in columns or "search_text" not in columns:
+        return
+
+    try:
+        con.execute("LOAD fts;")
+        con.execute(
+            "PRAGMA create_fts_index('pages', 'file_path', 'search_text', "
+            "stemmer='porter', overwrite=1);"
+        )
+    except duckdb.Error as e:
+        logger.warning("Full-text index not built (fts extension unavailable): %s", e)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -231,6 +440,7 @@ def build_duckdb(
     seqs_path: Path,
     *,
     overwrite: bool = True,
+    fts: bool = False,
 ) -> None:
     """
     Build (or rebuild) a DuckDB database for search & analytics.
@@ -241,41 +451,39 @@ def build_duckdb(
         Location where `lantern.duckdb` (or similar) should live.
 
     pages_path:
-        Path to the exported `pages.jsonl` file from the pipeline.
+        Path to the exported `pages.jsonl` file from the pipeline. If an
+        up-to-date `pages.parquet` sits next to it, that is read instead.
 
     seqs_path:
         Path to the exported `sequences.jsonl` file from the pipeline.
 
     overwrite:
         If True (default), existing tables will be replaced.
+
+    fts:
+        If True, build a DuckDB full-text (BM25) index over
+        `pages.search_text`, keyed by `file_path`. Requires the `fts`
+        extension to be installed beforehand (`INSTALL fts;`); off by
+        default so building never reaches out to the network.
     """
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    pages = _load_jsonl(pages_path)
-    seqs = _load_jsonl(seqs_path)
-
-    pages_df = _build_page_dataframe(pages)
-    seqs_df = _build_sequence_dataframe(seqs)
-
-    print(f"📄 Pages loaded    : {len(pages_df)} rows")
-    print(f"🧵 Sequences loaded: {len(seqs_df)} rows")
-
     con = duckdb.connect(str(db_path))
 
-    # Register temporary views so we can create tables from them
-    con.register("pages_df", pages_df)
-    con.register("seqs_df", seqs_df)
-
     if overwrite:
         con.execute("DROP TABLE IF EXISTS pages;")
         con.execute("DROP TABLE IF EXISTS sequences;")
 
-    con.execute("CREATE TABLE IF NOT EXISTS pages AS SELECT * FROM pages_df;")
-    con.execute("CREATE TABLE IF NOT EXISTS sequences AS SELECT * FROM seqs_df;")
+    num_pages = _create_table(con, "pages", pages_path, _page_select_sql, _build_page_dataframe)
+    num_seqs = _create_table(
+        con, "sequences", seqs_path, _sequence_select_sql, _build_sequence_dataframe
+    )
+
+    print(f"📄 Pages loaded    : {num_pages} rows")
+    print(f"🧵 Sequences loaded: {num_seqs} rows")
 
-    # Placeholder for future performance tuning (indexes / projections / clustering)
-    # Example (when supported/needed):
-    #   con.execute('CREATE INDEX IF NOT EXISTS idx_pages_seq ON pages(sequence_id);')
+    if num_pages:
+        _finalize_pages_table(con, fts=fts)
 
     con.close()
     print(f"✅ DuckDB search database written to: {db_path}")
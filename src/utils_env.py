@@ -1,14 +1,33 @@
 import os
 from dotenv import load_dotenv
 
+# Parsed config from the first load_environment() call in this process.
+_CFG = None
 
-def load_environment():
+
+def load_environment(verbose=True, refresh=False):
     """
     Load .env configuration and return a structured config dict.
 
     This keeps all environment-related logic in one place so agents and
     pipelines can stay focused on their specific responsibilities.
+
+    The environment is only parsed once per process; later calls return a
+    copy of the cached config unless `refresh=True`. Pass `verbose=False`
+    to skip the status printout (e.g. in worker processes).
     """
+    global _CFG
+    if _CFG is None or refresh:
+        _CFG = _parse_environment()
+    cfg = dict(_CFG)
+
+    if verbose:
+        _print_status(cfg)
+
+    return cfg
+
+
+def _parse_environment():
     load_dotenv()
 
     gcp_project = os.getenv("GCP_PROJECT_ID")
@@ -62,7 +81,10 @@ def load_environment():
         "ocr_cache_dir": os.getenv("OCR_CACHE_DIR", "./data/ocr_cache"),
         "export_dir": os.getenv("EXPORT_DIR", "./data/outputs"),
     }
+    return cfg
 
+
+def _print_status(cfg):
     # Pretty print status (without revealing secrets)
     print("🔧 Environment loaded:")
     print(f"   • GCP Project: {cfg['gcp_project']}")
@@ -75,6 +97,4 @@ def load_environment():
 
     if cfg["effective_gemini_key"] is None:
         print("⚠️  No Gemini / Vertex API key detected. "
-              "OCR agents using Gemini will not function until a key is set.")
-
-    return cfg
\ No newline at end of file
+              "OCR agents using Gemini will not function until a key is set.")
\ No newline at end of file
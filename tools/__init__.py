@@ -13,25 +13,42 @@ Key modules
     Text normalization & safe truncation for noisy OCR.
 - ocr_tools:
     OCR result schema helpers, JSONL I/O, and cache-key utilities.
+
+Public names are loaded lazily (PEP 562): importing `tools` is cheap, and
+each submodule is only imported the first time one of its names is used.
 """
 
-from .cleanup_tools import (
-    normalize_whitespace,
-    basic_cleanup,
-    strip_control_chars,
-    collapse_hyphenation,
-    safe_truncate,
-)
-
-from .ocr_tools import (
-    OCRResult,
-    make_cache_key,
-    write_jsonl,
-    load_jsonl,
-    save_json,
-    normalize_ocr_record,
-    stub_ocr_for_path,
-)
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it
+_LAZY = {
+    # cleanup_tools
+    "normalize_whitespace": "cleanup_tools",
+    "basic_cleanup": "cleanup_tools",
+    "strip_control_chars": "cleanup_tools",
+    "collapse_hyphenation": "cleanup_tools",
+    "safe_truncate": "cleanup_tools",
+    "make_truncator": "cleanup_tools",
+    # ocr_tools
+    "OCRResult": "ocr_tools",
+    "OCRResultBatch": "ocr_tools",
+    "make_cache_key": "ocr_tools",
+    "cache_path_for": "ocr_tools",
+    "image_cache_path_for": "ocr_tools",
+    "write_jsonl": "ocr_tools",
+    "load_jsonl": "ocr_tools",
+    "load_jsonl_many": "ocr_tools",
+    "clear_jsonl_cache": "ocr_tools",
+    "save_json": "ocr_tools",
+    "atomic_write": "ocr_tools",
+    "json_dumps": "ocr_tools",
+    "json_loads": "ocr_tools",
+    "normalize_ocr_record": "ocr_tools",
+    "stub_ocr_for_path": "ocr_tools",
+}
 
 __all__ = [
     # cleanup_tools
@@ -40,12 +57,34 @@ __all__ = [
     "strip_control_chars",
     "collapse_hyphenation",
     "safe_truncate",
+    "make_truncator",
     # ocr_tools
     "OCRResult",
+    "OCRResultBatch",
     "make_cache_key",
+    "cache_path_for",
+    "image_cache_path_for",
     "write_jsonl",
     "load_jsonl",
+    "load_jsonl_many",
+    "clear_jsonl_cache",
     "save_json",
+    "atomic_write",
+    "json_dumps",
+    "json_loads",
     "normalize_ocr_record",
     "stub_ocr_for_path",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
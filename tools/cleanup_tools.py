@@ -14,11 +14,26 @@ These utilities are intentionally:
 from __future__ import annotations
 
 import re
-from typing import Optional
+from typing import Callable
 
 
-_WHITESPACE_RE = re.compile(r"\s+")
 _CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+# Same set as a str.translate deletion table
+_CONTROL_DELETE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F], None
+)
+# Word split as "multi-\nple" or "multi-\r\nple"
+_HYPHEN_RE = re.compile(r"(\w)-\s*\n\s*(\w)")
+_PLACEHOLDER = "[OCR_PLACEHOLDER]"
+_PLACEHOLDER_RE = re.compile(re.escape(_PLACEHOLDER))
+
+# Byte-level equivalents for pure-ASCII text (the common OCR case). On
+# ASCII input they behave exactly like the str patterns above: \w and \s
+# only differ outside ASCII, and \x1c-\x1f (str-only whitespace) are
+# control characters removed before the whitespace pass.
+_CONTROL_BYTES = bytes(range(0x00, 0x09)) + b"\x0b\x0c" + bytes(range(0x0e, 0x20)) + b"\x7f"
+_HYPHEN_BYTES_RE = re.compile(rb"(\w)-\s*\n\s*(\w)")
+_PLACEHOLDER_BYTES = _PLACEHOLDER.encode("ascii")
 
 
 def normalize_whitespace(text: str) -> str:
@@ -31,7 +46,10 @@ def normalize_whitespace(text: str) -> str:
     """
     if not text:
         return ""
-    return _WHITESPACE_RE.sub(" ", text).strip()
+    # str.split() and the regex \s class use the same whitespace predicate
+    # (checked over every code point), so this matches the old
+    # re.sub(r"\s+", " ", text).strip() exactly, NBSP and friends included.
+    return " ".join(text.split())
 
 
 def strip_control_chars(text: str) -> str:
@@ -44,6 +62,10 @@ def strip_control_chars(text: str) -> str:
     """
     if not text:
         return ""
+    # translate() is a tight C loop for ASCII strings but slower than the
+    # regex engine once it has to handle wider characters
+    if text.isascii():
+        return text.translate(_CONTROL_DELETE)
     return _CONTROL_CHARS_RE.sub("", text)
 
 
@@ -60,8 +82,7 @@ def collapse_hyphenation(text: str) -> str:
     """
     if not text:
         return ""
-    # Join words that are split as "multi-\nple" or "multi-\r\nple"
-    return re.sub(r"(\w)-\s*\n\s*(\w)", r"\1\2", text)
+    return _HYPHEN_RE.sub(r"\1\2", text)
 
 
 def basic_cleanup(text: str) -> str:
@@ -81,13 +102,47 @@ def basic_cleanup(text: str) -> str:
     """
     if not text:
         return ""
-    cleaned = strip_control_chars(text)
-    cleaned = collapse_hyphenation(cleaned)
-    cleaned = normalize_whitespace(cleaned)
-    cleaned = cleaned.replace("[OCR_PLACEHOLDER]", "").strip()
+    return _fused_cleanup(text)
+
+
+def _fused_cleanup(text: str) -> str:
+    """
+    basic_cleanup() without the per-helper call overhead.
+
+    Each rewrite still runs in C (regex engine / str methods); a
+    character-level Python loop would be far slower than that. Instead,
+    passes that cannot change anything are skipped using cheap substring
+    checks, so typical pages allocate one or two strings instead of four.
+    `re.sub` hands back the input object itself when nothing matches.
+    """
+    if text.isascii():
+        return _fused_cleanup_ascii(text.encode("ascii")).decode("ascii")
+
+    cleaned = _CONTROL_CHARS_RE.sub("", text)
+    if "-" in cleaned and "\n" in cleaned:
+        cleaned = _HYPHEN_RE.sub(r"\1\2", cleaned)
+    cleaned = " ".join(cleaned.split())
+    if _PLACEHOLDER in cleaned:
+        cleaned = _PLACEHOLDER_RE.sub("", cleaned).strip()
     return cleaned
 
 
+def _fused_cleanup_ascii(data: bytes) -> bytes:
+    """
+    _fused_cleanup() over ASCII bytes: control characters are dropped with
+    bytes.translate's C deletion loop instead of a regex substitution.
+    """
+    data = data.translate(None, _CONTROL_BYTES)
+    if b"-" in data and b"\n" in data:
+        data = _HYPHEN_BYTES_RE.sub(rb"\1\2", data)
+    # bytes.split() splits on exactly the ASCII \s set, so this equals
+    # re.sub(rb"\s+", b" ", data).strip() without the regex engine
+    data = b" ".join(data.split())
+    if _PLACEHOLDER_BYTES in data:
+        data = data.replace(_PLACEHOLDER_BYTES, b"").strip()
+    return data
+
+
 def safe_truncate(text: str, max_chars: int, suffix: str = "…") -> str:
     """
     Soft truncate text for UI / summaries.
@@ -115,4 +170,43 @@ def safe_truncate(text: str, max_chars: int, suffix: str = "…") -> str:
     if len(suffix) >= max_chars:
         # Edge case: suffix longer than allowed length
         return suffix[:max_chars]
-    return text[: max_chars - len(suffix)] + suffix
\ No newline at end of file
+    return text[: max_chars - len(suffix)] + suffix
+
+
+def make_truncator(max_chars: int, suffix: str = "…") -> Callable[[str], str]:
+    """
+    Build a safe_truncate() specialized for a fixed `max_chars` / `suffix`.
+
+    The limit checks and suffix length are resolved once here, so the
+    returned function only does the length test and the slice. Use it when
+    the same limit is applied to many strings (UI lists, summaries).
+
+    Example
+    -------
+    trunc_200 = make_truncator(200)
+    trunc_200(text) == safe_truncate(text, 200)
+    """
+    if max_chars <= 0:
+        return lambda text: ""
+
+    if len(suffix) >= max_chars:
+        # Edge case: suffix longer than allowed length
+        truncated = suffix[:max_chars]
+
+        def _truncate(text: str) -> str:
+            if not text:
+                return ""
+            return text if len(text) <= max_chars else truncated
+
+        return _truncate
+
+    limit = max_chars - len(suffix)
+
+    def _truncate(text: str) -> str:
+        if not text:
+            return ""
+        if len(text) <= max_chars:
+            return text
+        return text[:limit] + suffix
+
+    return _truncate
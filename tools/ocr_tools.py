@@ -20,23 +20,58 @@ These helpers can be used by:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import hashlib
 import json
 import logging
+import os
+import sys
+import threading
 
-from .cleanup_tools import basic_cleanup
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .cleanup_tools import _PLACEHOLDER, basic_cleanup
 
 logger = logging.getLogger(__name__)
 
+# OCR records and stubs are re-normalized often; the cleanup is a pure
+# function of the page text, so memoize it.
+_cached_cleanup = lru_cache(maxsize=1024)(basic_cleanup)
+
+# write_jsonl(): records serialized per write() call, and the file buffer size
+_JSONL_WRITE_BATCH = 1000
+_JSONL_BUFFER_BYTES = 1 << 20
+# load_jsonl(): files above this size are streamed instead of read whole
+_JSONL_SLURP_MAX_BYTES = 256 << 20
+_JSONL_READ_BUFFER_BYTES = 4 << 20
+# load_jsonl() cache of parsed files, bounded by total on-disk bytes (parsed
+# records take several times that in memory); bigger files are not cached
+_JSONL_CACHE_MAX_BYTES = 64 << 20
+_JSONL_CACHE_MAX_FILE_BYTES = 16 << 20
+# Longer error strings tend to be unique (paths, tracebacks): not worth interning
+_INTERN_ERROR_MAX_CHARS = 64
+
 
 # ---------------------------------------------------------------------------
 # OCR result schema
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """
     Canonical OCR result schema used across Project LANTERN.
@@ -64,6 +99,16 @@ class OCRResult:
     model: str = "unknown"
     engine: str = "unknown"
 
+    def __post_init__(self) -> None:
+        # model / engine (and short error messages) repeat across thousands
+        # of records; interning keeps one copy of each distinct value.
+        if type(self.model) is str:
+            self.model = sys.intern(self.model)
+        if type(self.engine) is str:
+            self.engine = sys.intern(self.engine)
+        if type(self.error) is str and len(self.error) <= _INTERN_ERROR_MAX_CHARS:
+            self.error = sys.intern(self.error)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to a dict with the keys expected by downstream components:
@@ -75,15 +120,15 @@ class OCRResult:
         - model
         - engine
         """
-        data = asdict(self)
+        raw_text = self.raw_text
         return {
-            "ocr_text": data["raw_text"],
-            "raw_text": data["raw_text"],
-            "clean_text": data["clean_text"],
-            "confidence": data["confidence"],
-            "error": data["error"],
-            "model": data["model"],
-            "engine": data["engine"],
+            "ocr_text": raw_text,
+            "raw_text": raw_text,
+            "clean_text": self.clean_text,
+            "confidence": self.confidence,
+            "error": self.error,
+            "model": self.model,
+            "engine": self.engine,
         }
 
 
@@ -107,44 +152,281 @@ def normalize_ocr_record(
         - "model" (optional)
         - "engine" (optional)
     """
-    raw = (
-        record.get("ocr_text")
-        or record.get("raw_text")
-        or record.get("clean_text")
-        or ""
-    )
-    clean = basic_cleanup(record.get("clean_text") or raw)
-
-    try:
-        conf_val = float(record.get("confidence", 0.0))
-    except Exception:
-        conf_val = 0.0
+    get = record.get
+    clean_in = get("clean_text")
+    raw = get("ocr_text") or get("raw_text") or clean_in or ""
+    text = clean_in or raw
+    # Records produced by this pipeline are usually clean already
+    clean = text if _is_clean(text) else _cached_cleanup(text)
+
+    conf_val = get("confidence", 0.0)
+    if type(conf_val) is not float:
+        try:
+            conf_val = float(conf_val)
+        except Exception:
+            conf_val = 0.0
 
     return OCRResult(
         raw_text=raw,
         clean_text=clean,
         confidence=conf_val,
-        error=record.get("error"),
-        model=str(record.get("model") or default_model),
-        engine=str(record.get("engine") or default_engine),
+        error=get("error"),
+        model=str(get("model") or default_model),
+        engine=str(get("engine") or default_engine),
+    )
+
+
+def _is_clean(text: str) -> bool:
+    """
+    True if basic_cleanup(text) would return `text` unchanged.
+
+    isprintable() rules out control characters and every whitespace
+    character except " " (and with it any line-break hyphenation), so
+    only doubled / edge spaces and placeholder markers remain to check.
+    Each test is a single C-level scan.
+    """
+    return (
+        text.isprintable()
+        and "  " not in text
+        and not text.startswith(" ")
+        and not text.endswith(" ")
+        and _PLACEHOLDER not in text
     )
 
 
+# ---------------------------------------------------------------------------
+# Columnar batches
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class OCRResultBatch:
+    """
+    Many OCR results stored column-wise (structure of arrays).
+
+    Use this instead of a list of OCRResult for bulk work: aggregations run
+    as numpy column operations instead of Python loops over records.
+
+    Fields
+    ------
+    raw_text, clean_text, error:
+        Per-record lists, as in OCRResult.
+    confidence_u8:
+        Confidence quantized to uint8 (round(confidence * 255), clipped to
+        0..255; NaN -> 0). `confidence_f32` gives it back in [0, 1]. Only
+        ~2 significant digits survive, which is all the OCR scores carry.
+    model, engine:
+        Integer category codes; the strings are `model_labels[code]` and
+        `engine_labels[code]`.
+    """
+
+    raw_text: List[str]
+    clean_text: List[str]
+    confidence_u8: np.ndarray
+    error: List[Optional[str]]
+    model: np.ndarray
+    engine: np.ndarray
+    model_labels: List[str]
+    engine_labels: List[str]
+
+    def __len__(self) -> int:
+        return len(self.raw_text)
+
+    @property
+    def confidence_f32(self) -> np.ndarray:
+        """Dequantized confidence in [0, 1] as float32."""
+        return self.confidence_u8.astype(np.float32) / np.float32(255)
+
+    @classmethod
+    def from_results(cls, results: Iterable[OCRResult]) -> "OCRResultBatch":
+        """Build a batch from OCRResult objects."""
+        if np is None:
+            raise ImportError("OCRResultBatch requires numpy to be installed.")
+
+        results = list(results)
+        model, model_labels = _category_codes([r.model for r in results])
+        engine, engine_labels = _category_codes([r.engine for r in results])
+        confidence = np.fromiter(
+            (r.confidence for r in results), dtype=np.float32, count=len(results)
+        )
+        return cls(
+            raw_text=[r.raw_text for r in results],
+            clean_text=[r.clean_text for r in results],
+            confidence_u8=_quantize_confidence(confidence),
+            error=[r.error for r in results],
+            model=model,
+            engine=engine,
+            model_labels=model_labels,
+            engine_labels=engine_labels,
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        *,
+        default_model: str = "unknown",
+        default_engine: str = "unknown",
+    ) -> "OCRResultBatch":
+        """Build a batch from loosely structured OCR dicts (see normalize_ocr_record)."""
+        return cls.from_results(
+            normalize_ocr_record(
+                rec, default_model=default_model, default_engine=default_engine
+            )
+            for rec in records
+        )
+
+    def to_records(self, *, quantized_confidence: bool = False) -> List[Dict[str, Any]]:
+        """
+        Convert back to OCRResult.to_dict() dicts.
+
+        "confidence" is the dequantized float by default; with
+        quantized_confidence=True it is the raw 0..255 integer instead
+        (smaller JSONL, but readers must know to divide by 255).
+        """
+        if quantized_confidence:
+            confidence = self.confidence_u8.tolist()
+        else:
+            confidence = self.confidence_f32.tolist()
+        models = [self.model_labels[c] for c in self.model.tolist()]
+        engines = [self.engine_labels[c] for c in self.engine.tolist()]
+        return [
+            {
+                "ocr_text": raw,
+                "raw_text": raw,
+                "clean_text": clean,
+                "confidence": conf,
+                "error": err,
+                "model": model,
+                "engine": engine,
+            }
+            for raw, clean, conf, err, model, engine in zip(
+                self.raw_text,
+                self.clean_text,
+                confidence,
+                self.error,
+                models,
+                engines,
+            )
+        ]
+
+    def mean_confidence_by_engine(self) -> Dict[str, float]:
+        """Mean confidence per engine, via a weighted bincount."""
+        n = len(self.engine_labels)
+        totals = np.bincount(self.engine, weights=self.confidence_f32, minlength=n)
+        counts = np.bincount(self.engine, minlength=n)
+        return {
+            label: float(totals[i] / counts[i])
+            for i, label in enumerate(self.engine_labels)
+            if counts[i]
+        }
+
+
+def _quantize_confidence(confidence: np.ndarray) -> np.ndarray:
+    scaled = np.round(np.nan_to_num(confidence, nan=0.0) * 255)
+    return np.clip(scaled, 0, 255).astype(np.uint8)
+
+
+def _category_codes(values: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """Encode strings as integer codes (first-seen order) plus their labels."""
+    index: Dict[str, int] = {}
+    codes = [index.setdefault(v, len(index)) for v in values]
+    dtype = np.uint8 if len(index) <= 256 else np.int32
+    return np.asarray(codes, dtype=dtype), list(index)
+
+
 # ---------------------------------------------------------------------------
 # File / cache helpers
 # ---------------------------------------------------------------------------
 
 
+def json_dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize `obj` to UTF-8 JSON bytes, using orjson when available.
+
+    NaN / inf are written as null by orjson (stdlib json writes bare NaN).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by stdlib json may contain bare NaN, which
+            # orjson rejects; let the stdlib parser handle those.
+            pass
+    return json.loads(data)
+
+
 def make_cache_key(rel_path: str) -> str:
     """
-    Turn a relative file path into a safe cache file name.
+    Turn a relative file path into a safe, bounded-length cache file name.
+
+    The name is the file stem (truncated to 40 chars, for debugging) plus a
+    128-bit blake2b digest of the full path, so deep paths never exceed
+    the filesystem's name limit.
+
+    Example
+    -------
+    "A_clean_ocr/HOUSE_OVERSIGHT_011638.jpg"
+    -> "HOUSE_OVERSIGHT_011638_f1d7b3b756139715bbb019cc568c390d.json"
+    """
+    return f"{Path(rel_path).stem[:40]}_{_path_digest(rel_path)}.json"
+
+
+def cache_path_for(cache_dir: Union[str, Path], rel_path: str) -> Path:
+    """
+    Location of the path-keyed OCR cache file for `rel_path` under `cache_dir`.
+
+    Files are sharded into subdirectories named after the first two hex
+    chars of the path digest (256 shards), which keeps every directory
+    small. A cache file with the old flat "dir__file.jpg.json" name is
+    moved into place on first lookup.
 
     Example
     -------
     "A_clean_ocr/HOUSE_OVERSIGHT_011638.jpg"
-    -> "A_clean_ocr__HOUSE_OVERSIGHT_011638.jpg.json"
+    -> cache_dir / "f1" / "HOUSE_OVERSIGHT_011638_f1d7b3b756139715bbb019cc568c390d.json"
+    """
+    cache_dir = Path(cache_dir)
+    digest = _path_digest(rel_path)
+    path = _shard_path(cache_dir, digest, f"{Path(rel_path).stem[:40]}_{digest}.json")
+    if not path.exists():
+        legacy = cache_dir / (rel_path.replace("/", "__") + ".json")
+        if legacy.exists():
+            ensure_parent_dir(path)
+            try:
+                os.replace(legacy, path)
+            except FileNotFoundError:
+                # another process migrated it first
+                pass
+    return path
+
+
+def image_cache_path_for(cache_dir: Union[str, Path], image_digest: str) -> Path:
+    """
+    Location of the content-addressed OCR cache file for an image digest.
+
+    Uses the same 256-way sharding as cache_path_for():
+    cache_dir / "3f" / "3f....img.json".
     """
-    return rel_path.replace("/", "__") + ".json"
+    return _shard_path(Path(cache_dir), image_digest, f"{image_digest}.img.json")
+
+
+def _shard_path(cache_dir: Path, digest: str, name: str) -> Path:
+    return cache_dir / digest[:2] / name
+
+
+def _path_digest(rel_path: str) -> str:
+    return hashlib.blake2b(rel_path.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def ensure_parent_dir(path: Path) -> None:
@@ -154,6 +436,32 @@ def ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _fsync_enabled() -> bool:
+    """FSYNC_WRITES=true trades write throughput for durability across crashes."""
+    return os.getenv("FSYNC_WRITES", "false").lower() == "true"
+
+
+@contextmanager
+def atomic_write(path: Path, buffering: int = -1) -> Iterator[BinaryIO]:
+    """
+    Open a temp file next to `path` for binary writing; on success it is
+    renamed over `path` with os.replace (atomic on POSIX and NTFS), so a
+    crash mid-write never leaves a truncated file behind.
+    """
+    ensure_parent_dir(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open("wb", buffering=buffering) as f:
+            yield f
+            if _fsync_enabled():
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def save_json(record: Dict[str, Any], path: Union[str, Path]) -> None:
     """
     Write a single JSON object to disk with UTF-8 encoding.
@@ -161,12 +469,14 @@ def save_json(record: Dict[str, Any], path: Union[str, Path]) -> None:
     This is useful for:
     - Per-page OCR cache files
     - Simple diagnostics dumps
+
+    The file is replaced atomically (see atomic_write).
     """
     p = Path(path)
-    ensure_parent_dir(p)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(record, f, ensure_ascii=False, indent=2)
-    logger.debug("Wrote JSON record to %s", p)
+    with atomic_write(p) as f:
+        f.write(json_dumps(record, indent=True))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Wrote JSON record to %s", p)
 
 
 # ---------------------------------------------------------------------------
@@ -178,21 +488,29 @@ def write_jsonl(records: Iterable[Dict[str, Any]], out_path: Union[str, Path]) -
     """
     Write an iterable of dict records to disk as JSON Lines (JSONL).
 
-    Each record is written as one JSON object per line.
+    Each record is written as one JSON object per line. Records are
+    serialized in batches and each batch goes out in a single write().
+    The file is replaced atomically (see atomic_write).
 
     This helper is intentionally generic so it can be reused by:
     - src/pipeline.py (pages.jsonl, sequences.jsonl)
     - ad-hoc notebook exports
     """
     p = Path(out_path)
-    ensure_parent_dir(p)
     count = 0
-    with p.open("w", encoding="utf-8") as f:
+    chunk: List[bytes] = []
+    with atomic_write(p, buffering=_JSONL_BUFFER_BYTES) as f:
         for rec in records:
-            json.dump(rec, f, ensure_ascii=False)
-            f.write("\n")
-            count += 1
-    logger.info("Wrote %d JSONL records to %s", count, p)
+            chunk.append(json_dumps(rec))
+            if len(chunk) >= _JSONL_WRITE_BATCH:
+                f.write(b"\n".join(chunk) + b"\n")
+                count += len(chunk)
+                chunk.clear()
+        if chunk:
+            f.write(b"\n".join(chunk) + b"\n")
+            count += len(chunk)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Wrote %d JSONL records to %s", count, p)
 
 
 def load_jsonl(path: Union[str, Path]) -> List[Dict[str, Any]]:
@@ -203,25 +521,112 @@ def load_jsonl(path: Union[str, Path]) -> List[Dict[str, Any]]:
     --------
     - Returns an empty list if the file does not exist.
     - Skips malformed lines but logs a warning.
+    - Files up to _JSONL_CACHE_MAX_FILE_BYTES are kept in a process-local
+      LRU keyed by (path, mtime, size) and bounded to
+      _JSONL_CACHE_MAX_BYTES in total, so re-loading an unchanged file
+      only costs a shallow copy of each record. Top-level keys can be
+      changed freely, but nested values (e.g. "entities" lists) are
+      shared with the cache and must not be mutated in place.
+      clear_jsonl_cache() drops the cache.
     """
     p = Path(path)
-    if not p.exists():
+    try:
+        st = p.stat()
+    except FileNotFoundError:
         logger.warning("JSONL file not found, skipping: %s", p)
         return []
 
+    if st.st_size > _JSONL_CACHE_MAX_FILE_BYTES:
+        # Too big to keep around; parse it fresh every time
+        return _read_jsonl(p, st.st_size)
+    return [
+        dict(rec) if isinstance(rec, dict) else rec
+        for rec in _read_jsonl_cached(p, st.st_mtime_ns, st.st_size)
+    ]
+
+
+def _read_jsonl(p: Path, size: int) -> List[Dict[str, Any]]:
+    if size > _JSONL_SLURP_MAX_BYTES:
+        with p.open("rb", buffering=_JSONL_READ_BUFFER_BYTES) as f:
+            records = _parse_jsonl_lines(f, p)
+    else:
+        lines = p.read_bytes().split(b"\n")
+        try:
+            # JSON parsers skip surrounding whitespace ("\r" included), so
+            # well-formed files need no per-line strip()
+            records = [json_loads(line) for line in lines if line]
+        except ValueError:
+            records = _parse_jsonl_lines(lines, p)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Loaded %d JSONL records from %s", len(records), p)
+    return records
+
+
+_jsonl_cache: "OrderedDict[Tuple[str, int, int], List[Dict[str, Any]]]" = OrderedDict()
+_jsonl_cache_bytes = 0
+_jsonl_cache_lock = threading.Lock()
+
+
+def _read_jsonl_cached(p: Path, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    global _jsonl_cache_bytes
+    # mtime_ns / size are part of the key: a changed file misses
+    key = (str(p), mtime_ns, size)
+    with _jsonl_cache_lock:
+        records = _jsonl_cache.get(key)
+        if records is not None:
+            _jsonl_cache.move_to_end(key)
+            return records
+
+    records = _read_jsonl(p, size)
+    with _jsonl_cache_lock:
+        if key not in _jsonl_cache:
+            _jsonl_cache[key] = records
+            _jsonl_cache_bytes += size
+            while _jsonl_cache_bytes > _JSONL_CACHE_MAX_BYTES:
+                (_, _, old_size), _ = _jsonl_cache.popitem(last=False)
+                _jsonl_cache_bytes -= old_size
+    return records
+
+
+def clear_jsonl_cache() -> None:
+    """Drop every file parsed by load_jsonl() from its in-process cache."""
+    global _jsonl_cache_bytes
+    with _jsonl_cache_lock:
+        _jsonl_cache.clear()
+        _jsonl_cache_bytes = 0
+
+
+def load_jsonl_many(paths: Sequence[Union[str, Path]]) -> List[List[Dict[str, Any]]]:
+    """
+    load_jsonl() over several files at once; results are in input order.
+
+    Files are read on a small thread pool so reads of one shard overlap
+    with parsing of another. Flatten with itertools.chain.from_iterable()
+    if a single list of records is needed.
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [load_jsonl(p) for p in paths]
+    workers = min(8, os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(load_jsonl, paths))
+
+
+def _parse_jsonl_lines(lines: Iterable[bytes], p: Path) -> List[Dict[str, Any]]:
+    """
+    Line-by-line parse that skips blank lines and logs malformed ones.
+    """
     records: List[Dict[str, Any]] = []
-    with p.open("r", encoding="utf-8") as f:
-        for idx, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError as e:
-                logger.warning(
-                    "Skipping malformed JSON line %d in %s: %s", idx, p, e
-                )
-    logger.info("Loaded %d JSONL records from %s", len(records), p)
+    for idx, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append(json_loads(line))
+        except ValueError as e:  # JSONDecodeError / invalid UTF-8
+            logger.warning(
+                "Skipping malformed JSON line %d in %s: %s", idx, p, e
+            )
     return records
 
 
@@ -255,7 +660,7 @@ def stub_ocr_for_path(
     """
     p = Path(image_path)
     stub_text = f"[OCR_PLACEHOLDER] Text for {p.name}"
-    cleaned = basic_cleanup(stub_text)
+    cleaned = _cached_cleanup(stub_text)
 
     return OCRResult(
         raw_text=stub_text,